@@ -16,11 +16,13 @@ This is a comprehensive TUI application featuring:
 
 import os
 import sys
+import atexit
 import time
 import math
 import random
 import signal
 import shutil
+import shlex
 import subprocess
 import threading
 import queue
@@ -32,13 +34,40 @@ import struct
 import re
 import json
 import hashlib
+import functools
+import weakref
 from datetime import datetime
-from collections import deque, defaultdict
-from typing import List, Tuple, Optional, Dict, Any, Callable
+from collections import deque, defaultdict, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from array import array
+from typing import List, Tuple, Optional, Dict, Any, Callable, Mapping, Union
+from types import MappingProxyType
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import traceback
 
+# Optional fast JSON parser; falls back to the stdlib. Files are always
+# written with the stdlib encoder, since orjson writes NaN and Infinity as null
+try:
+    import orjson as _json
+
+    # orjson reads integers past 64 bits as floats, so long digit runs go to json
+    _LONG_DIGITS = re.compile(rb'\d{19}')
+
+    def _json_loads(data: bytes) -> Any:
+        try:
+            if not _LONG_DIGITS.search(data):
+                return _json.loads(data)
+        except ValueError:
+            # NaN, Infinity, out-of-range floats and lone surrogates are
+            # accepted by the stdlib parser but not by orjson
+            pass
+        return json.loads(data)
+except ImportError:
+    _json = json
+    _json_loads = _json.loads
+
 # ============================================================================
 # CONSTANTS AND CONFIGURATION
 # ============================================================================
@@ -135,11 +164,13 @@ class Color:
     """ANSI color utilities"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def rgb(r: int, g: int, b: int) -> str:
         """Convert RGB to ANSI escape sequence"""
         return f"\x1b[38;2;{int(r)};{int(g)};{int(b)}m"
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def bg_rgb(r: int, g: int, b: int) -> str:
         """Convert RGB to ANSI background escape sequence"""
         return f"\x1b[48;2;{int(r)};{int(g)};{int(b)}m"
@@ -203,6 +234,7 @@ class Cursor:
         return "\x1b[?25h"
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
     def move(x: int, y: int) -> str:
         """Move cursor to position"""
         return f"\x1b[{y+1};{x+1}H"
@@ -270,6 +302,11 @@ class Screen:
         """Switch to main screen buffer"""
         return "\x1b[?1049l"
     
+    @staticmethod
+    def focus_reporting(enable: bool) -> str:
+        """Enable/disable focus in/out reports (ESC [ I / ESC [ O)"""
+        return "\x1b[?1004h" if enable else "\x1b[?1004l"
+    
     @staticmethod
     def get_size() -> Tuple[int, int]:
         """Get terminal size (columns, rows)"""
@@ -389,16 +426,18 @@ class ParallaxShader(Shader):
             # Distance from current pixel to star
             dx = (uv_x - star_x) * res_x / 50.0
             dy = (uv_y - star_y) * res_y / 50.0
-            dist = math.sqrt(dx * dx + dy * dy)
+            dist_sq = dx * dx + dy * dy
             
             # Flicker effect
             flicker = 0.7 + 0.3 * math.sin(time_val * star['flicker_speed'] + star['flicker_offset'])
             
-            # Star intensity based on distance
+            # Star intensity based on distance; most stars are out of range,
+            # so compare squared distances and only take the root when needed
             size = star['size'] * flicker
             intensity = 0.0
             
-            if dist < size:
+            if dist_sq < size * size:
+                dist = math.sqrt(dist_sq)
                 intensity = 1.0 - (dist / size)
                 intensity = smoothstep(0.0, 1.0, intensity)
                 
@@ -563,7 +602,10 @@ class ChristmasTreeShader(Shader):
                 # Check if light is close to this pixel
                 dx = x - light['x']
                 dy = (height - 0.5) * 2 - light['y']
-                dist_2d = math.sqrt(dx * dx + dy * dy)
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= 0.15 * 0.15:
+                    continue
+                dist_2d = math.sqrt(dist_sq)
                 
                 if dist_2d < 0.05:
                     # Flicker
@@ -673,10 +715,10 @@ class SnowShader(Shader):
             # Distance to snowflake
             dx = (uv_x - flake_x) * res_x / 20.0
             dy = (uv_y - flake_y) * res_y / 20.0
-            dist = math.sqrt(dx * dx + dy * dy)
+            dist_sq = dx * dx + dy * dy
             
-            if dist < flake['size']:
-                intensity = 1.0 - (dist / flake['size'])
+            if dist_sq < flake['size'] * flake['size']:
+                intensity = 1.0 - (math.sqrt(dist_sq) / flake['size'])
                 alpha = int(255 * intensity * 0.8)
                 return (255, 255, 255, alpha)
         
@@ -1778,6 +1820,7 @@ class Application:
         
         # Switch to alternate screen
         sys.stdout.write(Screen.alternate_screen())
+        sys.stdout.write(Screen.focus_reporting(True))
         sys.stdout.write(Cursor.hide())
         sys.stdout.write(Screen.clear())
         sys.stdout.flush()
@@ -1788,6 +1831,7 @@ class Application:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_terminal_settings)
         
         # Restore screen
+        sys.stdout.write(Screen.focus_reporting(False))
         sys.stdout.write(Screen.main_screen())
         sys.stdout.write(Cursor.show())
         sys.stdout.write(Color.reset())
@@ -1843,6 +1887,8 @@ class Application:
                     # Check if we have a complete sequence
                     if next_char in ('~', 'A', 'B', 'C', 'D', 'F', 'H'):
                         break
+                    if seq in ('\x1b[I', '\x1b[O'):  # Focus in/out
+                        break
                 return seq
             
             return char
@@ -2250,6 +2296,11 @@ class Application:
                 # Process input (multiple keys per frame for responsiveness)
                 for _ in range(10):  # Process up to 10 keys per frame
                     input_char = self.read_input()
+                    if input_char in ('\x1b[I', '\x1b[O'):
+                        # Terminal focus changed: plugins poll slowly while unfocused
+                        if self.plugin_manager:
+                            self.plugin_manager.set_visible(input_char == '\x1b[I')
+                        continue
                     if input_char:
                         # Check if plugin handles it
                         if self.plugin_manager and self.plugin_manager.on_input(input_char):
@@ -2709,10 +2760,44 @@ class ThemeManager:
 class Plugin:
     """Base plugin class"""
     
+    _RESET = Color.reset()
+    
+    # Shared worker that keeps data sampling off the render thread
+    _sample_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plugin-sample")
+    
     def __init__(self, name: str, version: str):
         self.name = name
         self.version = version
         self.enabled = True
+        self._sample_future: Optional[Future] = None
+        # Hidden plugins refresh their data at most every hidden_interval
+        self.visible = True
+        self.hidden_interval = 60.0
+    
+    def set_visible(self, visible: bool):
+        """Called when the plugin's output is shown or hidden"""
+        self.visible = visible
+    
+    def poll_interval(self, interval: float) -> float:
+        """Refresh interval to use given the current visibility"""
+        return interval if self.visible else max(interval, self.hidden_interval)
+    
+    def _poll_sample(self, sample: Callable[[], Any], due: bool) -> Any:
+        """Run sample() in the background when due; return a finished result or None"""
+        result = None
+        future = self._sample_future
+        if future is not None and future.done():
+            result = future.result()
+            self._sample_future = None
+        if due and self._sample_future is None:
+            self._sample_future = self._sample_pool.submit(sample)
+        return result
+    
+    def _cancel_sample(self):
+        """Drop a background sample that has not started yet"""
+        if self._sample_future is not None:
+            self._sample_future.cancel()
+            self._sample_future = None
     
     def on_load(self):
         """Called when plugin is loaded"""
@@ -2768,6 +2853,11 @@ class PluginManager:
                     return result
         return None
     
+    def set_visible(self, visible: bool):
+        """Tell plugins whether their output is currently seen"""
+        for plugin in self.plugins.values():
+            plugin.set_visible(visible)
+    
     def on_render(self, context: Dict[str, Any]) -> List[str]:
         """Collect render output from plugins"""
         output = []
@@ -3227,7 +3317,7 @@ class CommandParser:
     @staticmethod
     def parse(command_string: str) -> Command:
         """Parse a command string"""
-        parts = command_string.strip().split()
+        parts = command_string.split()
         
         if not parts:
             return Command("", [], {})
@@ -3326,29 +3416,41 @@ class CommandExecutor:
             return "Usage: plugin [list|load|unload] [name]"
         
         action = command.args[0]
-        
-        if action == "list":
-            plugins = self.app.plugin_manager.list_plugins()
-            if plugins:
-                return "Loaded plugins:\n" + "\n".join(f"  - {p}" for p in plugins)
-            else:
-                return "No plugins loaded"
-        
-        elif action == "load":
-            if len(command.args) < 2:
-                return "Usage: plugin load NAME"
-            # Plugin loading would be implemented here
-            return f"Plugin loading not implemented in this demo"
-        
-        elif action == "unload":
-            if len(command.args) < 2:
-                return "Usage: plugin unload NAME"
-            plugin_name = command.args[1]
-            self.app.plugin_manager.unload_plugin(plugin_name)
-            return f"Plugin unloaded: {plugin_name}"
+        handler = self._PLUGIN_ACTIONS.get(action)
+        if handler:
+            return handler(self, command)
         
         return f"Unknown action: {action}"
     
+    def _plugin_list(self, command: Command) -> str:
+        """List loaded plugins"""
+        plugins = self.app.plugin_manager.list_plugins()
+        if plugins:
+            return "Loaded plugins:\n" + "\n".join(f"  - {p}" for p in plugins)
+        else:
+            return "No plugins loaded"
+    
+    def _plugin_load(self, command: Command) -> str:
+        """Load a plugin"""
+        if len(command.args) < 2:
+            return "Usage: plugin load NAME"
+        # Plugin loading would be implemented here
+        return f"Plugin loading not implemented in this demo"
+    
+    def _plugin_unload(self, command: Command) -> str:
+        """Unload a plugin"""
+        if len(command.args) < 2:
+            return "Usage: plugin unload NAME"
+        plugin_name = command.args[1]
+        self.app.plugin_manager.unload_plugin(plugin_name)
+        return f"Plugin unloaded: {plugin_name}"
+    
+    _PLUGIN_ACTIONS = {
+        'list': _plugin_list,
+        'load': _plugin_load,
+        'unload': _plugin_unload,
+    }
+    
     def cmd_keybinds(self, command: Command) -> str:
         """Show keybindings"""
         bindings = [
@@ -3399,9 +3501,12 @@ class CommandExecutor:
     def cmd_history(self, command: Command) -> str:
         """Show command history"""
         if self.app.terminal:
-            commands = list(self.app.terminal.command_history.commands)
+            commands = self.app.terminal.command_history.commands
             if commands:
-                return "\n".join(f"{i+1}. {cmd}" for i, cmd in enumerate(commands[-20:]))
+                # Index from the tail; deque lookups near either end are O(1)
+                n = len(commands)
+                start = max(0, n - 20)
+                return "\n".join(f"{i+1}. {commands[i]}" for i in range(start, n))
             else:
                 return "No command history"
         return ""
@@ -3413,6 +3518,8 @@ class CommandExecutor:
 class ExtendedCommandExecutor(CommandExecutor):
     """Extended command executor with more commands"""
     
+    _NOTIF_TYPES = frozenset({'info', 'warning', 'error', 'success'})
+    
     def register_builtin_commands(self):
         """Register all built-in commands"""
         super().register_builtin_commands()
@@ -3444,30 +3551,42 @@ class ExtendedCommandExecutor(CommandExecutor):
             return "No sessions"
         
         action = command.args[0]
-        
-        if action == "new":
-            name = command.args[1] if len(command.args) > 1 else "session"
-            session_id = self.app.session_manager.create_session(name)
-            return f"Created session: {session_id}"
-        
-        elif action == "switch":
-            if len(command.args) < 2:
-                return "Usage: session switch SESSION_ID"
-            session_id = command.args[1]
-            if self.app.session_manager.switch_session(session_id):
-                return f"Switched to session: {session_id}"
-            return f"Session not found: {session_id}"
-        
-        elif action == "close":
-            if len(command.args) < 2:
-                return "Usage: session close SESSION_ID"
-            session_id = command.args[1]
-            if self.app.session_manager.close_session(session_id):
-                return f"Closed session: {session_id}"
-            return f"Session not found: {session_id}"
+        handler = self._SESSION_ACTIONS.get(action)
+        if handler:
+            return handler(self, command)
         
         return f"Unknown action: {action}"
     
+    def _session_new(self, command: Command) -> str:
+        """Create a new session"""
+        name = command.args[1] if len(command.args) > 1 else "session"
+        session_id = self.app.session_manager.create_session(name)
+        return f"Created session: {session_id}"
+    
+    def _session_switch(self, command: Command) -> str:
+        """Switch to another session"""
+        if len(command.args) < 2:
+            return "Usage: session switch SESSION_ID"
+        session_id = command.args[1]
+        if self.app.session_manager.switch_session(session_id):
+            return f"Switched to session: {session_id}"
+        return f"Session not found: {session_id}"
+    
+    def _session_close(self, command: Command) -> str:
+        """Close a session"""
+        if len(command.args) < 2:
+            return "Usage: session close SESSION_ID"
+        session_id = command.args[1]
+        if self.app.session_manager.close_session(session_id):
+            return f"Closed session: {session_id}"
+        return f"Session not found: {session_id}"
+    
+    _SESSION_ACTIONS = {
+        'new': _session_new,
+        'switch': _session_switch,
+        'close': _session_close,
+    }
+    
     def cmd_tab(self, command: Command) -> str:
         """Tab management"""
         if not command.args:
@@ -3481,32 +3600,46 @@ class ExtendedCommandExecutor(CommandExecutor):
             return "No tabs"
         
         action = command.args[0]
-        
-        if action == "new":
-            name = command.args[1] if len(command.args) > 1 else "Tab"
-            session = self.app.session_manager.get_active_session()
-            if session:
-                tab_id = self.app.tab_manager.create_tab(name, session.id)
-                return f"Created tab: {tab_id}"
-            return "No active session"
-        
-        elif action == "next":
-            self.app.tab_manager.next_tab()
-            return "Switched to next tab"
-        
-        elif action == "prev":
-            self.app.tab_manager.prev_tab()
-            return "Switched to previous tab"
-        
-        elif action == "close":
-            active_tab = self.app.tab_manager.get_active_tab()
-            if active_tab:
-                self.app.tab_manager.close_tab(active_tab.id)
-                return f"Closed tab: {active_tab.name}"
-            return "No active tab"
+        handler = self._TAB_ACTIONS.get(action)
+        if handler:
+            return handler(self, command)
         
         return f"Unknown action: {action}"
     
+    def _tab_new(self, command: Command) -> str:
+        """Create a new tab in the active session"""
+        name = command.args[1] if len(command.args) > 1 else "Tab"
+        session = self.app.session_manager.get_active_session()
+        if session:
+            tab_id = self.app.tab_manager.create_tab(name, session.id)
+            return f"Created tab: {tab_id}"
+        return "No active session"
+    
+    def _tab_next(self, command: Command) -> str:
+        """Switch to the next tab"""
+        self.app.tab_manager.next_tab()
+        return "Switched to next tab"
+    
+    def _tab_prev(self, command: Command) -> str:
+        """Switch to the previous tab"""
+        self.app.tab_manager.prev_tab()
+        return "Switched to previous tab"
+    
+    def _tab_close(self, command: Command) -> str:
+        """Close the active tab"""
+        active_tab = self.app.tab_manager.get_active_tab()
+        if active_tab:
+            self.app.tab_manager.close_tab(active_tab.id)
+            return f"Closed tab: {active_tab.name}"
+        return "No active tab"
+    
+    _TAB_ACTIONS = {
+        'new': _tab_new,
+        'next': _tab_next,
+        'prev': _tab_prev,
+        'close': _tab_close,
+    }
+    
     def cmd_search(self, command: Command) -> str:
         """Search through output"""
         if not command.args:
@@ -3528,23 +3661,33 @@ class ExtendedCommandExecutor(CommandExecutor):
             return "No macros defined"
         
         action = command.args[0]
-        
-        if action == "record":
-            if len(command.args) < 2:
-                return "Usage: macro record NAME"
-            name = command.args[1]
-            self.app.macro_manager.start_recording(name)
-            return f"Recording macro: {name}"
-        
-        elif action == "stop":
-            if len(command.args) < 2:
-                return "Usage: macro stop TRIGGER"
-            trigger = command.args[1]
-            self.app.macro_manager.stop_recording(trigger)
-            return f"Macro saved with trigger: {trigger}"
+        handler = self._MACRO_ACTIONS.get(action)
+        if handler:
+            return handler(self, command)
         
         return f"Unknown action: {action}"
     
+    def _macro_record(self, command: Command) -> str:
+        """Start recording a macro"""
+        if len(command.args) < 2:
+            return "Usage: macro record NAME"
+        name = command.args[1]
+        self.app.macro_manager.start_recording(name)
+        return f"Recording macro: {name}"
+    
+    def _macro_stop(self, command: Command) -> str:
+        """Stop recording and save the macro"""
+        if len(command.args) < 2:
+            return "Usage: macro stop TRIGGER"
+        trigger = command.args[1]
+        self.app.macro_manager.stop_recording(trigger)
+        return f"Macro saved with trigger: {trigger}"
+    
+    _MACRO_ACTIONS = {
+        'record': _macro_record,
+        'stop': _macro_stop,
+    }
+    
     def cmd_script(self, command: Command) -> str:
         """Script management"""
         if not command.args:
@@ -3554,29 +3697,41 @@ class ExtendedCommandExecutor(CommandExecutor):
             return "No scripts loaded"
         
         action = command.args[0]
-        
-        if action == "load":
-            if len(command.args) < 2:
-                return "Usage: script load FILEPATH"
-            filepath = command.args[1]
-            if self.app.script_engine.load_script_from_file(filepath):
-                return f"Loaded script: {filepath}"
-            return f"Failed to load script: {filepath}"
-        
-        elif action == "run":
-            if len(command.args) < 2:
-                return "Usage: script run NAME"
-            name = command.args[1]
-            if self.app.script_engine.start_script(name):
-                return f"Running script: {name}"
-            return f"Script not found: {name}"
-        
-        elif action == "stop":
-            self.app.script_engine.stop_script()
-            return "Stopped script"
+        handler = self._SCRIPT_ACTIONS.get(action)
+        if handler:
+            return handler(self, command)
         
         return f"Unknown action: {action}"
     
+    def _script_load(self, command: Command) -> str:
+        """Load a script from a file"""
+        if len(command.args) < 2:
+            return "Usage: script load FILEPATH"
+        filepath = command.args[1]
+        if self.app.script_engine.load_script_from_file(filepath):
+            return f"Loaded script: {filepath}"
+        return f"Failed to load script: {filepath}"
+    
+    def _script_run(self, command: Command) -> str:
+        """Run a loaded script"""
+        if len(command.args) < 2:
+            return "Usage: script run NAME"
+        name = command.args[1]
+        if self.app.script_engine.start_script(name):
+            return f"Running script: {name}"
+        return f"Script not found: {name}"
+    
+    def _script_stop(self, command: Command) -> str:
+        """Stop the running script"""
+        self.app.script_engine.stop_script()
+        return "Stopped script"
+    
+    _SCRIPT_ACTIONS = {
+        'load': _script_load,
+        'run': _script_run,
+        'stop': _script_stop,
+    }
+    
     def cmd_copy(self, command: Command) -> str:
         """Copy text to clipboard"""
         if not command.args:
@@ -3603,53 +3758,65 @@ class ExtendedCommandExecutor(CommandExecutor):
             return "\n".join(lines)
         
         action = command.args[0]
+        handler = self._CONFIG_ACTIONS.get(action)
+        if handler:
+            return handler(self, command)
         
-        if action == "get":
-            if len(command.args) < 2:
-                return "Usage: config get KEY"
-            key = command.args[1]
-            value = self.app.config_manager.get(key)
-            return f"{key} = {value}"
-        
-        elif action == "set":
-            if len(command.args) < 3:
-                return "Usage: config set KEY VALUE"
-            key = command.args[1]
-            value = " ".join(command.args[2:])
-            
-            # Try to parse value
-            try:
-                if value.lower() == 'true':
-                    value = True
-                elif value.lower() == 'false':
-                    value = False
-                elif value.isdigit():
-                    value = int(value)
-                elif value.replace('.', '', 1).isdigit():
-                    value = float(value)
-            except:
-                pass
-            
-            self.app.config_manager.set(key, value)
-            return f"Set {key} = {value}"
+        return f"Unknown action: {action}"
+    
+    def _config_get(self, command: Command) -> str:
+        """Show a configuration value"""
+        if len(command.args) < 2:
+            return "Usage: config get KEY"
+        key = command.args[1]
+        value = self.app.config_manager.get(key)
+        return f"{key} = {value}"
+    
+    def _config_set(self, command: Command) -> str:
+        """Set a configuration value"""
+        if len(command.args) < 3:
+            return "Usage: config set KEY VALUE"
+        key = command.args[1]
+        value = " ".join(command.args[2:])
         
-        elif action == "save":
-            self.app.config_manager.save_config()
-            return "Configuration saved"
+        # Try to parse value
+        try:
+            if value.lower() == 'true':
+                value = True
+            elif value.lower() == 'false':
+                value = False
+            elif value.isdigit():
+                value = int(value)
+            elif value.replace('.', '', 1).isdigit():
+                value = float(value)
+        except:
+            pass
         
-        return f"Unknown action: {action}"
+        self.app.config_manager.set(key, value)
+        return f"Set {key} = {value}"
+    
+    def _config_save(self, command: Command) -> str:
+        """Save the configuration to disk"""
+        self.app.config_manager.save_config()
+        return "Configuration saved"
+    
+    _CONFIG_ACTIONS = {
+        'get': _config_get,
+        'set': _config_set,
+        'save': _config_save,
+    }
     
     def cmd_notify(self, command: Command) -> str:
         """Show a notification"""
         if not command.args:
             return "Usage: notify MESSAGE [type]"
         
-        message = " ".join(command.args[:-1]) if len(command.args) > 1 else " ".join(command.args)
-        notif_type = command.args[-1] if len(command.args) > 1 and command.args[-1] in ['info', 'warning', 'error', 'success'] else 'info'
-        
-        if notif_type in ['info', 'warning', 'error', 'success']:
-            message = " ".join(command.args[:-1])
+        args = command.args
+        if len(args) > 1 and args[-1] in self._NOTIF_TYPES:
+            message = " ".join(args[:-1])
+            notif_type = args[-1]
         else:
+            message = " ".join(args)
             notif_type = 'info'
         
         self.app.notification_manager.add_notification(message, notif_type)
@@ -3689,8 +3856,8 @@ class ExtendedCommandExecutor(CommandExecutor):
         macro = self.app.macro_manager.get_macro(name)
         
         if macro:
-            # Execute macro commands
-            for action in macro.actions:
+            # Execute macro commands (parsed once at record time)
+            for action in macro.compiled_actions:
                 # This would need to be integrated into the input system
                 pass
             return f"Played macro: {name}"
@@ -3710,7 +3877,15 @@ class Session:
     output_buffer: TerminalOutputBuffer
     command_history: CommandHistory
     working_directory: str
-    environment: Dict[str, str]
+    # A live read-only view of os.environ until the first set_env, which
+    # copies it; before that the session sees later os.environ changes
+    environment: Mapping[str, str]
+    
+    def set_env(self, key: str, value: str):
+        """Set an environment variable, copying the shared view on first write"""
+        if not isinstance(self.environment, dict):
+            self.environment = dict(self.environment)
+        self.environment[key] = value
 
 class SessionManager:
     """Manages multiple terminal sessions"""
@@ -3730,7 +3905,7 @@ class SessionManager:
             output_buffer=TerminalOutputBuffer(),
             command_history=CommandHistory(),
             working_directory=os.getcwd(),
-            environment=os.environ.copy()
+            environment=MappingProxyType(os.environ)
         )
         
         self.sessions[session_id] = session
@@ -3795,8 +3970,8 @@ class ConfigManager:
         """Load configuration from file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    self.config = _json_loads(f.read())
             else:
                 self.config = self.get_default_config()
                 self.save_config()
@@ -3806,8 +3981,8 @@ class ConfigManager:
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            with open(self.config_file, 'wb') as f:
+                f.write(json.dumps(self.config, indent=2).encode())
         except Exception as e:
             pass
     
@@ -3853,24 +4028,30 @@ class Macro:
     trigger: str
     actions: List[str]
     enabled: bool = True
+    compiled_actions: List[Command] = field(default_factory=list)
 
 class MacroManager:
     """Manages keyboard macros"""
     
     def __init__(self):
         self.macros: Dict[str, Macro] = {}
+        self._by_trigger: Dict[str, Macro] = {}
         self.recording = False
         self.recording_macro_name: Optional[str] = None
         self.recorded_actions: List[str] = []
     
     def add_macro(self, macro: Macro):
         """Add a macro"""
+        self.remove_macro(macro.name)
         self.macros[macro.name] = macro
+        self._by_trigger[macro.trigger] = macro
     
     def remove_macro(self, name: str):
         """Remove a macro"""
         if name in self.macros:
-            del self.macros[name]
+            macro = self.macros.pop(name)
+            if self._by_trigger.get(macro.trigger) is macro:
+                del self._by_trigger[macro.trigger]
     
     def get_macro(self, name: str) -> Optional[Macro]:
         """Get a macro by name"""
@@ -3878,9 +4059,9 @@ class MacroManager:
     
     def find_macro_by_trigger(self, trigger: str) -> Optional[Macro]:
         """Find a macro by its trigger"""
-        for macro in self.macros.values():
-            if macro.enabled and macro.trigger == trigger:
-                return macro
+        macro = self._by_trigger.get(trigger)
+        if macro is not None and macro.enabled:
+            return macro
         return None
     
     def start_recording(self, name: str):
@@ -3895,7 +4076,8 @@ class MacroManager:
             macro = Macro(
                 name=self.recording_macro_name,
                 trigger=trigger,
-                actions=self.recorded_actions.copy()
+                actions=self.recorded_actions.copy(),
+                compiled_actions=[CommandParser.parse(a) for a in self.recorded_actions]
             )
             self.add_macro(macro)
         
@@ -3934,7 +4116,7 @@ class SearchEngine:
         self.last_results = []
         self.current_result_index = 0
         
-        lines = list(output_buffer.lines)
+        lines = output_buffer.lines
         
         if regex:
             try:
@@ -4046,6 +4228,7 @@ class ScriptEngine:
         self.running_script: Optional[Script] = None
         self.script_delay = 0.5  # Delay between commands in seconds
         self.last_command_time = 0.0
+        self._next_ready_at = math.inf  # When update() may next return a command
     
     def add_script(self, script: Script):
         """Add a script"""
@@ -4068,6 +4251,7 @@ class ScriptEngine:
             script.running = True
             self.running_script = script
             self.last_command_time = time.time()
+            self._next_ready_at = self.last_command_time + self.script_delay
             return True
         return False
     
@@ -4076,14 +4260,15 @@ class ScriptEngine:
         if self.running_script:
             self.running_script.running = False
             self.running_script = None
+        self._next_ready_at = math.inf
     
     def update(self, current_time: float) -> Optional[str]:
         """Update script execution, returns next command if ready"""
-        if not self.running_script or not self.running_script.running:
+        # Cheap early exit while idle or waiting out the delay
+        if current_time < self._next_ready_at:
             return None
         
-        # Check if enough time has passed
-        if current_time - self.last_command_time < self.script_delay:
+        if not self.running_script or not self.running_script.running:
             return None
         
         # Get next command
@@ -4091,6 +4276,7 @@ class ScriptEngine:
         
         if command:
             self.last_command_time = current_time
+            self._next_ready_at = current_time + self.script_delay
             return command
         else:
             # Script finished
@@ -4104,8 +4290,14 @@ class ScriptEngine:
     def load_script_from_file(self, filepath: str) -> bool:
         """Load a script from a file"""
         try:
+            # One bulk read; text mode keeps universal newlines and the locale encoding
             with open(filepath, 'r') as f:
-                commands = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+                data = f.read()
+            commands = [
+                line.strip()
+                for line in data.split('\n')
+                if line.strip() and not line.startswith('#')
+            ]
             
             script_name = os.path.basename(filepath)
             script = Script(script_name, commands)
@@ -4125,18 +4317,28 @@ class Tab:
     name: str
     session_id: str
     created_at: float
+    # Neighbours in the circular tab order
+    prev_id: Optional[str] = None
+    next_id: Optional[str] = None
 
 class TabManager:
     """Manages terminal tabs"""
     
+    # Background + foreground escape codes for the two tab states
+    _ACTIVE_TAB_STYLE = Color.bg_rgb(60, 80, 120) + Color.rgb(255, 255, 255)
+    _INACTIVE_TAB_STYLE = Color.bg_rgb(40, 45, 55) + Color.rgb(180, 180, 200)
+    
     def __init__(self):
+        # Insertion order of the dict is the tab order; each Tab also links
+        # to its neighbours so next/prev/close are O(1)
         self.tabs: Dict[str, Tab] = {}
         self.active_tab_id: Optional[str] = None
-        self.tab_order: List[str] = []
+        self._next_tab_id = 0
     
     def create_tab(self, name: str, session_id: str) -> str:
         """Create a new tab"""
-        tab_id = hashlib.md5(f"{name}{time.time()}".encode()).hexdigest()[:8]
+        tab_id = f"t{self._next_tab_id:x}"
+        self._next_tab_id += 1
         
         tab = Tab(
             id=tab_id,
@@ -4145,8 +4347,19 @@ class TabManager:
             created_at=time.time()
         )
         
+        # Link in after the last tab, which is the first tab's predecessor
+        if self.tabs:
+            first = self.tabs[next(iter(self.tabs))]
+            last = self.tabs[first.prev_id]
+            tab.prev_id = last.id
+            tab.next_id = first.id
+            last.next_id = tab_id
+            first.prev_id = tab_id
+        else:
+            tab.prev_id = tab_id
+            tab.next_id = tab_id
+        
         self.tabs[tab_id] = tab
-        self.tab_order.append(tab_id)
         
         if self.active_tab_id is None:
             self.active_tab_id = tab_id
@@ -4172,31 +4385,29 @@ class TabManager:
     
     def next_tab(self):
         """Switch to next tab"""
-        if not self.tab_order or not self.active_tab_id:
+        if not self.tabs or not self.active_tab_id:
             return
         
-        current_index = self.tab_order.index(self.active_tab_id)
-        next_index = (current_index + 1) % len(self.tab_order)
-        self.active_tab_id = self.tab_order[next_index]
+        self.active_tab_id = self.tabs[self.active_tab_id].next_id
     
     def prev_tab(self):
         """Switch to previous tab"""
-        if not self.tab_order or not self.active_tab_id:
+        if not self.tabs or not self.active_tab_id:
             return
         
-        current_index = self.tab_order.index(self.active_tab_id)
-        prev_index = (current_index - 1) % len(self.tab_order)
-        self.active_tab_id = self.tab_order[prev_index]
+        self.active_tab_id = self.tabs[self.active_tab_id].prev_id
     
     def close_tab(self, tab_id: str) -> bool:
         """Close a tab"""
         if tab_id in self.tabs:
-            del self.tabs[tab_id]
-            self.tab_order.remove(tab_id)
+            tab = self.tabs.pop(tab_id)
+            if self.tabs:
+                self.tabs[tab.prev_id].next_id = tab.next_id
+                self.tabs[tab.next_id].prev_id = tab.prev_id
             
             if self.active_tab_id == tab_id:
-                if self.tab_order:
-                    self.active_tab_id = self.tab_order[-1]
+                if self.tabs:
+                    self.active_tab_id = next(reversed(self.tabs))
                 else:
                     self.active_tab_id = None
             
@@ -4205,12 +4416,10 @@ class TabManager:
     
     def list_tabs(self) -> List[Tuple[str, str, bool]]:
         """List all tabs (id, name, is_active)"""
-        result = []
-        for tab_id in self.tab_order:
-            tab = self.tabs[tab_id]
-            is_active = (tab_id == self.active_tab_id)
-            result.append((tab_id, tab.name, is_active))
-        return result
+        return [
+            (tab_id, tab.name, tab_id == self.active_tab_id)
+            for tab_id, tab in self.tabs.items()
+        ]
     
     def render_tab_bar(self, width: int, y: int, time_val: float) -> List[str]:
         """Render tab bar"""
@@ -4221,33 +4430,25 @@ class TabManager:
         output.append(Color.bg_rgb(30, 35, 45))
         output.append(' ' * width)
         
-        # Draw tabs
+        # Draw tabs, one pre-formatted string per tab
         x_offset = 2
-        for i, tab_id in enumerate(self.tab_order):
-            tab = self.tabs[tab_id]
-            is_active = (tab_id == self.active_tab_id)
+        row = y + 1
+        for tab_id, tab in self.tabs.items():
+            if tab_id == self.active_tab_id:
+                style = self._ACTIVE_TAB_STYLE
+            else:
+                style = self._INACTIVE_TAB_STYLE
             
             # Tab text
             tab_text = f" {tab.name} "
-            if len(tab_text) > 20:
+            text_len = len(tab_text)
+            if text_len > 20:
                 tab_text = tab_text[:17] + "... "
+                text_len = 21
             
-            # Colors
-            if is_active:
-                bg_color = (60, 80, 120)
-                fg_color = (255, 255, 255)
-            else:
-                bg_color = (40, 45, 55)
-                fg_color = (180, 180, 200)
-            
-            # Draw tab
-            output.append(Cursor.move(x_offset, y))
-            output.append(Color.bg_rgb(*bg_color))
-            output.append(Color.rgb(*fg_color))
-            output.append(tab_text)
-            output.append(Color.reset())
+            output.append(f"\x1b[{row};{x_offset + 1}H{style}{tab_text}\x1b[0m")
             
-            x_offset += len(tab_text) + 1
+            x_offset += text_len + 1
             
             if x_offset >= width - 10:
                 break
@@ -4261,44 +4462,106 @@ class TabManager:
 class ClipboardManager:
     """Manages clipboard operations"""
     
+    # Copies arriving within this window are written to the system clipboard once
+    COPY_DEBOUNCE = 0.02
+    
+    _COPY_COMMANDS = {
+        'xclip': ['xclip', '-selection', 'clipboard'],
+        'xsel': ['xsel', '--clipboard'],
+    }
+    _PASTE_COMMANDS = {
+        'xclip': ['xclip', '-selection', 'clipboard', '-o'],
+        'xsel': ['xsel', '--clipboard'],
+    }
+    
     def __init__(self):
         self.clipboard_content = ""
         self.history: deque = deque(maxlen=50)
+        self._history_set: set = set()
+        self._clipboard_tool: Optional[str] = None
+        self._tool_probed = False
+        self._lock = threading.Lock()
+        # Held across a whole write so flushes reach the clipboard in order
+        self._flush_lock = threading.Lock()
+        self._pending: Optional[str] = None
+        self._wakeup = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+    
+    def _get_clipboard_tool(self) -> Optional[str]:
+        """Find the system clipboard tool once and remember it"""
+        if not self._tool_probed:
+            self._tool_probed = True
+            for tool in ('xclip', 'xsel'):
+                if shutil.which(tool):
+                    self._clipboard_tool = tool
+                    break
+        return self._clipboard_tool
     
     def copy(self, text: str):
         """Copy text to clipboard"""
         self.clipboard_content = text
-        if text and text not in self.history:
+        if text and text not in self._history_set:
+            if len(self.history) == self.history.maxlen:
+                self._history_set.discard(self.history[0])
             self.history.append(text)
-        
-        # Try to use system clipboard
-        try:
-            # Try xclip
-            subprocess.run(['xclip', '-selection', 'clipboard'], 
-                         input=text.encode(), check=False, timeout=1)
-        except:
+            self._history_set.add(text)
+        
+        # Coalesce bursts of copies into a single system clipboard write,
+        # done by one long-lived writer thread started on first use
+        with self._lock:
+            self._pending = text
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+                self._writer.start()
+                # The daemon writer dies with the process, so flush what it still holds
+                atexit.register(self.close)
+        self._wakeup.set()
+    
+    def close(self):
+        """Write any copy still waiting for the writer thread"""
+        self._flush()
+    
+    def _writer_loop(self):
+        """Wait for a copy, then flush COPY_DEBOUNCE seconds later"""
+        while True:
+            self._wakeup.wait()
+            time.sleep(self.COPY_DEBOUNCE)
+            self._wakeup.clear()
+            self._flush()
+    
+    def _flush(self):
+        """Write the latest pending copy to the system clipboard"""
+        with self._flush_lock:
+            with self._lock:
+                text = self._pending
+                self._pending = None
+            
+            tool = self._get_clipboard_tool()
+            if text is None or tool is None:
+                return
+            
             try:
-                # Try xsel
-                subprocess.run(['xsel', '--clipboard'], 
+                subprocess.run(self._COPY_COMMANDS[tool],
                              input=text.encode(), check=False, timeout=1)
-            except:
+            except Exception:
                 pass
     
     def paste(self) -> str:
         """Paste text from clipboard"""
+        # A copy that has not been flushed yet is newer than the system clipboard
+        with self._lock:
+            if self._pending is not None:
+                return self._pending
+        
         # Try to get from system clipboard first
-        try:
-            result = subprocess.run(['xclip', '-selection', 'clipboard', '-o'], 
-                                  capture_output=True, text=True, timeout=1)
-            if result.returncode == 0 and result.stdout:
-                return result.stdout
-        except:
+        tool = self._get_clipboard_tool()
+        if tool:
             try:
-                result = subprocess.run(['xsel', '--clipboard'], 
+                result = subprocess.run(self._PASTE_COMMANDS[tool],
                                       capture_output=True, text=True, timeout=1)
                 if result.returncode == 0 and result.stdout:
                     return result.stdout
-            except:
+            except Exception:
                 pass
         
         return self.clipboard_content
@@ -4319,48 +4582,61 @@ class PerformanceMonitor:
         self.render_times: deque = deque(maxlen=60)
         self.update_times: deque = deque(maxlen=60)
         self.last_frame_time = 0.0
+        
+        # Running totals of the samples currently held in each window
+        self._frame_sum = 0.0
+        self._render_sum = 0.0
+        self._update_sum = 0.0
+    
+    @staticmethod
+    def _push(samples: deque, total: float, value: float) -> float:
+        """Append a sample to a bounded window and return the updated total"""
+        if len(samples) == samples.maxlen:
+            total -= samples[0]
+        samples.append(value)
+        return total + value
     
     def start_frame(self):
         """Mark start of frame"""
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.perf_counter()
     
     def end_frame(self):
         """Mark end of frame"""
-        frame_time = time.time() - self.last_frame_time
-        self.frame_times.append(frame_time)
+        frame_time = time.perf_counter() - self.last_frame_time
+        self._frame_sum = self._push(self.frame_times, self._frame_sum, frame_time)
     
     def record_render_time(self, render_time: float):
         """Record render time"""
-        self.render_times.append(render_time)
+        self._render_sum = self._push(self.render_times, self._render_sum, render_time)
     
     def record_update_time(self, update_time: float):
         """Record update time"""
-        self.update_times.append(update_time)
+        self._update_sum = self._push(self.update_times, self._update_sum, update_time)
     
     def get_fps(self) -> float:
         """Get average FPS"""
         if not self.frame_times:
             return 0.0
-        avg_time = sum(self.frame_times) / len(self.frame_times)
+        avg_time = self._frame_sum / len(self.frame_times)
         return 1.0 / avg_time if avg_time > 0 else 0.0
     
     def get_avg_render_time(self) -> float:
         """Get average render time"""
         if not self.render_times:
             return 0.0
-        return sum(self.render_times) / len(self.render_times)
+        return self._render_sum / len(self.render_times)
     
     def get_avg_update_time(self) -> float:
         """Get average update time"""
         if not self.update_times:
             return 0.0
-        return sum(self.update_times) / len(self.update_times)
+        return self._update_sum / len(self.update_times)
     
     def get_stats(self) -> Dict[str, float]:
         """Get performance statistics"""
         return {
             'fps': self.get_fps(),
-            'avg_frame_time': sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0,
+            'avg_frame_time': self._frame_sum / len(self.frame_times) if self.frame_times else 0.0,
             'avg_render_time': self.get_avg_render_time(),
             'avg_update_time': self.get_avg_update_time(),
         }
@@ -4378,6 +4654,15 @@ class BrailleCanvas:
         (1, 0, 0x08), (1, 1, 0x10), (1, 2, 0x20), (1, 3, 0x80)
     ]
     
+    # Dot bit for a sub-pixel, indexed by (sub_y << 1) | sub_x
+    _SUBPIX_MASK = bytes(mask for _, _, mask in sorted(DOTS, key=lambda d: (d[1], d[0])))
+    
+    # Number of raised dots for every pattern byte
+    _DOT_COUNT = bytes(bin(i).count('1') for i in range(256))
+    
+    # Braille glyph for every pattern byte
+    _BRAILLE_CHARS = tuple(chr(0x2800 + i) for i in range(256))
+    
     def __init__(self, width: int, height: int):
         """Initialize canvas (width and height in characters)"""
         self.char_width = width
@@ -4385,66 +4670,102 @@ class BrailleCanvas:
         self.pixel_width = width * 2
         self.pixel_height = height * 4
         
-        # Buffer: [y][x] = (pattern_bits, r, g, b)
-        self.buffer = [
-            [(0, 0, 0, 0) for _ in range(self.char_width)]
-            for _ in range(self.char_height)
-        ]
+        # Character cells packed into one flat buffer of 16-bit lanes,
+        # (pattern, red_sum, green_sum, blue_sum) per cell at index
+        # (y * char_width + x) * 4. Colors are sums over the raised dots
+        # and are averaged at render time.
+        self.buffer = array('H', [0]) * (self.char_width * self.char_height * 4)
         
-        # Pixel buffer for sub-pixel access
-        self.pixels = [
-            [(0, 0, 0) for _ in range(self.pixel_width)]
-            for _ in range(self.pixel_height)
-        ]
+        # Zeroed copy that clear() copies over the live buffer
+        self._blank_buffer = array('H', self.buffer)
     
     def clear(self):
         """Clear the canvas"""
-        self.buffer = [
-            [(0, 0, 0, 0) for _ in range(self.char_width)]
-            for _ in range(self.char_height)
-        ]
-        self.pixels = [
-            [(0, 0, 0) for _ in range(self.pixel_width)]
-            for _ in range(self.pixel_height)
-        ]
+        # Zero the existing buffer in place rather than reallocating per frame
+        self.buffer[:] = self._blank_buffer
     
     def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
         """Set a pixel (sub-character resolution)"""
-        if not (0 <= x < self.pixel_width and 0 <= y < self.pixel_height):
-            return
-        
-        self.pixels[y][x] = color
-        
-        # Update braille character
-        char_x = x // 2
-        char_y = y // 4
-        sub_x = x % 2
-        sub_y = y % 4
-        
-        if char_y < self.char_height and char_x < self.char_width:
-            # Get current pattern and color
-            pattern, r, g, b = self.buffer[char_y][char_x]
+        self.set_pixels(((x, y),), color)
+    
+    def set_pixels(self, points, color: Tuple[int, int, int]):
+        """Set many pixels of one color in a single pass"""
+        pixel_width = self.pixel_width
+        pixel_height = self.pixel_height
+        self._set_pixels_unchecked(
+            [(x, y) for x, y in points if 0 <= x < pixel_width and 0 <= y < pixel_height],
+            color
+        )
+    
+    def _set_pixels_unchecked(self, points, color: Tuple[int, int, int]):
+        """Set pixels that the caller has already clipped to the canvas"""
+        # Bind everything the per-pixel loop touches to locals once
+        char_width = self.char_width
+        buffer = self.buffer
+        subpix_mask = self._SUBPIX_MASK
+        r, g, b = color
+        
+        for x, y in points:
+            cell = ((y >> 2) * char_width + (x >> 1)) << 2
+            bit = subpix_mask[((y & 3) << 1) | (x & 1)]
+            pattern = buffer[cell]
+            if pattern & bit:
+                continue
+            buffer[cell] = pattern | bit
             
-            # Set bit for this pixel
-            for dx, dy, mask in self.DOTS:
-                if dx == sub_x and dy == sub_y:
-                    pattern |= mask
-                    break
+            # Accumulate color; a dot contributes the color it was first set with
+            buffer[cell + 1] += r
+            buffer[cell + 2] += g
+            buffer[cell + 3] += b
+    
+    def _fill_cells(self, x0: int, y0: int, x1: int, y1: int, color: Tuple[int, int, int]):
+        """Set every dot in the clipped pixel box [x0, x1) x [y0, y1), one cell at a time"""
+        for char_y in range(y0 // 4, (y1 - 1) // 4 + 1):
+            # Dot masks of the covered sub-rows in the left and right columns
+            top = max(y0 - char_y * 4, 0)
+            bottom = min(y1 - char_y * 4, 4)
+            column_masks = [0, 0]
+            for sub_y in range(top, bottom):
+                column_masks[0] |= self._SUBPIX_MASK[sub_y << 1]
+                column_masks[1] |= self._SUBPIX_MASK[(sub_y << 1) | 1]
             
-            # Update color (average)
-            count = bin(pattern).count('1')
-            if count > 0:
-                self.buffer[char_y][char_x] = (
-                    pattern,
-                    (r * (count - 1) + color[0]) // count,
-                    (g * (count - 1) + color[1]) // count,
-                    (b * (count - 1) + color[2]) // count
-                )
-            else:
-                self.buffer[char_y][char_x] = (pattern, *color)
+            row = char_y * self.char_width
+            for char_x in range(x0 // 2, (x1 - 1) // 2 + 1):
+                mask = 0
+                if x0 <= char_x * 2 < x1:
+                    mask |= column_masks[0]
+                if x0 <= char_x * 2 + 1 < x1:
+                    mask |= column_masks[1]
+                
+                cell = (row + char_x) << 2
+                pattern = self.buffer[cell]
+                added = self._DOT_COUNT[mask & ~pattern]
+                if added:
+                    self.buffer[cell] = pattern | mask
+                    self.buffer[cell + 1] += color[0] * added
+                    self.buffer[cell + 2] += color[1] * added
+                    self.buffer[cell + 3] += color[2] * added
     
     def draw_line(self, x0: int, y0: int, x1: int, y1: int, color: Tuple[int, int, int]):
         """Draw a line using Bresenham's algorithm"""
+        # Axis-aligned lines are a single span fill
+        if y0 == y1:
+            self.fill_rect(min(x0, x1), y0, abs(x1 - x0) + 1, 1, color)
+            return
+        if x0 == x1:
+            self.fill_rect(x0, min(y0, y1), 1, abs(y1 - y0) + 1, color)
+            return
+        
+        # Cohen-Sutherland trivial tests: lines entirely off one side of
+        # the canvas are dropped, lines entirely on it skip the per-pixel
+        # bounds check. Crossing lines keep their real endpoints so their
+        # pixels match the unclipped line exactly.
+        code0 = self._outcode(x0, y0)
+        code1 = self._outcode(x1, y1)
+        if code0 & code1:
+            return
+        inside = not (code0 | code1)
+        
         dx = abs(x1 - x0)
         dy = abs(y1 - y0)
         sx = 1 if x0 < x1 else -1
@@ -4452,9 +4773,10 @@ class BrailleCanvas:
         err = dx - dy
         
         x, y = x0, y0
+        points = []
         
         while True:
-            self.set_pixel(x, y, color)
+            points.append((x, y))
             
             if x == x1 and y == y1:
                 break
@@ -4466,6 +4788,25 @@ class BrailleCanvas:
             if e2 < dx:
                 err += dx
                 y += sy
+        
+        if inside:
+            self._set_pixels_unchecked(points, color)
+        else:
+            self.set_pixels(points, color)
+    
+    def _outcode(self, x: int, y: int) -> int:
+        """Cohen-Sutherland region code of a point relative to the canvas"""
+        # Bits: 1 = left, 2 = right, 4 = above, 8 = below
+        code = 0
+        if x < 0:
+            code |= 1
+        elif x >= self.pixel_width:
+            code |= 2
+        if y < 0:
+            code |= 4
+        elif y >= self.pixel_height:
+            code |= 8
+        return code
     
     def draw_circle(self, cx: int, cy: int, radius: int, color: Tuple[int, int, int]):
         """Draw a circle using midpoint circle algorithm"""
@@ -4473,79 +4814,92 @@ class BrailleCanvas:
         y = 0
         err = 0
         
+        points = []
+        
         while x >= y:
-            self.set_pixel(cx + x, cy + y, color)
-            self.set_pixel(cx + y, cy + x, color)
-            self.set_pixel(cx - y, cy + x, color)
-            self.set_pixel(cx - x, cy + y, color)
-            self.set_pixel(cx - x, cy - y, color)
-            self.set_pixel(cx - y, cy - x, color)
-            self.set_pixel(cx + y, cy - x, color)
-            self.set_pixel(cx + x, cy - y, color)
+            points.extend((
+                (cx + x, cy + y), (cx + y, cy + x),
+                (cx - y, cy + x), (cx - x, cy + y),
+                (cx - x, cy - y), (cx - y, cy - x),
+                (cx + y, cy - x), (cx + x, cy - y),
+            ))
             
             y += 1
             err += 1 + 2 * y
             if 2 * (err - x) + 1 > 0:
                 x -= 1
                 err += 1 - 2 * x
+        
+        self.set_pixels(points, color)
     
     def fill_circle(self, cx: int, cy: int, radius: int, color: Tuple[int, int, int]):
         """Draw a filled circle"""
+        # Fill one horizontal span per row: x*x + y*y <= r*r  <=>  |x| <= isqrt(r*r - y*y)
         for y in range(-radius, radius + 1):
-            for x in range(-radius, radius + 1):
-                if x * x + y * y <= radius * radius:
-                    self.set_pixel(cx + x, cy + y, color)
+            half_width = math.isqrt(radius * radius - y * y)
+            self.fill_rect(cx - half_width, cy + y, 2 * half_width + 1, 1, color)
     
     def draw_rect(self, x: int, y: int, width: int, height: int, color: Tuple[int, int, int]):
         """Draw a rectangle outline"""
+        # Each edge is a span; fill_rect clips it to the canvas once
         # Top and bottom
-        for i in range(width):
-            self.set_pixel(x + i, y, color)
-            self.set_pixel(x + i, y + height - 1, color)
+        self.fill_rect(x, y, width, 1, color)
+        self.fill_rect(x, y + height - 1, width, 1, color)
         
         # Left and right
-        for i in range(height):
-            self.set_pixel(x, y + i, color)
-            self.set_pixel(x + width - 1, y + i, color)
+        self.fill_rect(x, y, 1, height, color)
+        self.fill_rect(x + width - 1, y, 1, height, color)
     
     def fill_rect(self, x: int, y: int, width: int, height: int, color: Tuple[int, int, int]):
         """Draw a filled rectangle"""
-        for j in range(height):
-            for i in range(width):
-                self.set_pixel(x + i, y + j, color)
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + width, self.pixel_width)
+        y1 = min(y + height, self.pixel_height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        self._fill_cells(x0, y0, x1, y1, color)
     
     def render(self, offset_x: int = 0, offset_y: int = 0) -> List[str]:
         """Render canvas to output"""
         output = []
+        buffer = self.buffer
+        dot_count = self._DOT_COUNT
+        braille_chars = self._BRAILLE_CHARS
+        reset = Color.reset()
         
         for y in range(self.char_height):
             line_output = []
             line_output.append(Cursor.move(offset_x, offset_y + y))
             
+            # Only format an escape code where a run of equal colors starts
             prev_color = None
             
-            for x in range(self.char_width):
-                pattern, r, g, b = self.buffer[y][x]
+            row = y * self.char_width * 4
+            for cell in range(row, row + self.char_width * 4, 4):
+                pattern = buffer[cell]
                 
                 if pattern == 0:
                     if prev_color is not None:
-                        line_output.append(Color.reset())
+                        line_output.append(reset)
                         prev_color = None
                     line_output.append(' ')
                 else:
-                    # Braille character
-                    char = chr(0x2800 + pattern)
-                    
-                    # Color
-                    color_code = Color.rgb(r, g, b)
-                    if color_code != prev_color:
-                        line_output.append(color_code)
-                        prev_color = color_code
+                    count = dot_count[pattern]
+                    color = (
+                        buffer[cell + 1] // count,
+                        buffer[cell + 2] // count,
+                        buffer[cell + 3] // count
+                    )
+                    if color != prev_color:
+                        line_output.append(Color.rgb(*color))
+                        prev_color = color
                     
-                    line_output.append(char)
+                    line_output.append(braille_chars[pattern])
             
             if prev_color is not None:
-                line_output.append(Color.reset())
+                line_output.append(reset)
             
             output.append(''.join(line_output))
         
@@ -4580,17 +4934,24 @@ class ASCIIArtRenderer:
         output = []
         lines = self.art_cache[name]
         
+        # Escape code for every line, computed before the render loop
+        line_colors: List[str] = []
+        if color:
+            if gradient and color2:
+                # Gradient from top to bottom
+                steps = max(len(lines) - 1, 1)
+                line_colors = [
+                    Color.rgb(*Color.gradient(color, color2, i / steps))
+                    for i in range(len(lines))
+                ]
+            else:
+                line_colors = [Color.rgb(*color)] * len(lines)
+        
         for i, line in enumerate(lines):
             output.append(Cursor.move(x, y + i))
             
             if color:
-                if gradient and color2:
-                    # Gradient from top to bottom
-                    t = i / max(len(lines) - 1, 1)
-                    line_color = Color.gradient(color, color2, t)
-                    output.append(Color.rgb(*line_color))
-                else:
-                    output.append(Color.rgb(*color))
+                output.append(line_colors[i])
             
             output.append(line)
             
@@ -4631,6 +4992,7 @@ class InputHandler:
     
     def __init__(self):
         self.key_bindings: Dict[str, List[Callable]] = defaultdict(list)
+        self._prefixes: set = set()  # Every non-empty prefix of every bound sequence
         self.input_buffer = ""
         self.escape_sequence_timeout = 0.1
         self.last_input_time = 0.0
@@ -4638,16 +5000,27 @@ class InputHandler:
     def bind_key(self, key_sequence: str, callback: Callable):
         """Bind a key sequence to a callback"""
         self.key_bindings[key_sequence].append(callback)
+        for i in range(1, len(key_sequence) + 1):
+            self._prefixes.add(key_sequence[:i])
     
     def unbind_key(self, key_sequence: str, callback: Optional[Callable] = None):
         """Unbind a key sequence"""
         if callback is None:
             if key_sequence in self.key_bindings:
                 del self.key_bindings[key_sequence]
+                self._rebuild_prefixes()
         else:
             if key_sequence in self.key_bindings:
                 self.key_bindings[key_sequence].remove(callback)
     
+    def _rebuild_prefixes(self):
+        """Recompute the prefix set after a binding is removed"""
+        self._prefixes = {
+            binding[:i]
+            for binding in self.key_bindings
+            for i in range(1, len(binding) + 1)
+        }
+    
     def process_input(self, char: str) -> bool:
         """Process input character. Returns True if handled."""
         current_time = time.time()
@@ -4673,12 +5046,7 @@ class InputHandler:
             return handled
         
         # Check if buffer could be a prefix of any binding
-        is_prefix = any(
-            binding.startswith(self.input_buffer)
-            for binding in self.key_bindings.keys()
-        )
-        
-        if not is_prefix:
+        if self.input_buffer not in self._prefixes:
             # No possible match, process as single char
             handled = self._try_execute(self.input_buffer)
             self.input_buffer = ""
@@ -4705,13 +5073,25 @@ class InputHandler:
 class FileBrowser:
     """File browser component"""
     
+    _SELECTED_STYLE = Color.bg_rgb(80, 120, 180) + Color.rgb(255, 255, 255)
+    _DIR_STYLE = Color.rgb(100, 180, 255)
+    _FILE_STYLE = Color.rgb(200, 210, 230)
+    _SCROLL_THUMB = Color.rgb(100, 150, 200) + '█'
+    _SCROLL_TRACK = Color.rgb(60, 70, 90) + '░'
+    
+    # Recent listings shared by all browsers: path -> (dir mtime_ns, names, is_dir)
+    LISTING_CACHE_SIZE = 16
+    _listing_cache: 'OrderedDict[str, Tuple[int, List[str], bytearray]]' = OrderedDict()
+    
     def __init__(self, width: int, height: int, x: int, y: int):
         self.width = width
         self.height = height
         self.x = x
         self.y = y
         self.current_path = os.getcwd()
-        self.files: List[Tuple[str, bool]] = []  # (name, is_dir)
+        # Listing as parallel arrays: names[i] and is_dir[i] (1 for directories)
+        self.names: List[str] = []
+        self.is_dir = bytearray()
         self.selected_index = 0
         self.scroll_offset = 0
         self.visible = False
@@ -4719,30 +5099,61 @@ class FileBrowser:
     
     def refresh(self):
         """Refresh file list"""
+        path = self.current_path
         try:
-            entries = os.listdir(self.current_path)
-            self.files = []
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        # Reuse a recent listing while the directory is unchanged
+        cache = self._listing_cache
+        cached = cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            cache.move_to_end(path)
+            _, self.names, self.is_dir = cached
+            return
+        
+        try:
+            # scandir reports the entry type from the directory read itself,
+            # so no extra stat() is needed per entry
+            with os.scandir(path) as it:
+                entries = list(it)
             
             # Add parent directory
-            if self.current_path != '/':
-                self.files.append(('..', True))
+            names = ['..'] if self.current_path != '/' else []
             
             # Add directories first, then files
             dirs = []
             files = []
             
-            for entry in sorted(entries):
-                full_path = os.path.join(self.current_path, entry)
-                if os.path.isdir(full_path):
-                    dirs.append((entry, True))
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirs.append(entry.name)
                 else:
-                    files.append((entry, False))
+                    files.append(entry.name)
+            
+            # Sort each half in place; no global pre-sort is needed
+            dirs.sort()
+            files.sort()
             
-            self.files.extend(dirs)
-            self.files.extend(files)
+            self.is_dir = bytearray(b'\x01') * (len(names) + len(dirs)) + bytearray(len(files))
+            names.extend(dirs)
+            names.extend(files)
+            self.names = names
+            
+            if mtime is not None:
+                cache[path] = (mtime, self.names, self.is_dir)
+                cache.move_to_end(path)
+                if len(cache) > self.LISTING_CACHE_SIZE:
+                    cache.popitem(last=False)
             
         except PermissionError:
-            self.files = [('..', True)]
+            self.names = ['..']
+            self.is_dir = bytearray(b'\x01')
     
     def navigate_up(self):
         """Navigate to parent directory"""
@@ -4755,10 +5166,10 @@ class FileBrowser:
     
     def navigate_down(self):
         """Navigate into selected directory"""
-        if self.files and 0 <= self.selected_index < len(self.files):
-            name, is_dir = self.files[self.selected_index]
+        if self.names and 0 <= self.selected_index < len(self.names):
+            name = self.names[self.selected_index]
             
-            if is_dir:
+            if self.is_dir[self.selected_index]:
                 if name == '..':
                     self.navigate_up()
                 else:
@@ -4769,8 +5180,8 @@ class FileBrowser:
     
     def select_next(self):
         """Select next file"""
-        if self.files:
-            self.selected_index = (self.selected_index + 1) % len(self.files)
+        if self.names:
+            self.selected_index = (self.selected_index + 1) % len(self.names)
             
             # Adjust scroll
             visible_count = self.height - 4
@@ -4781,8 +5192,8 @@ class FileBrowser:
     
     def select_prev(self):
         """Select previous file"""
-        if self.files:
-            self.selected_index = (self.selected_index - 1) % len(self.files)
+        if self.names:
+            self.selected_index = (self.selected_index - 1) % len(self.names)
             
             # Adjust scroll
             visible_count = self.height - 4
@@ -4793,8 +5204,8 @@ class FileBrowser:
     
     def get_selected_path(self) -> Optional[str]:
         """Get path of selected file"""
-        if self.files and 0 <= self.selected_index < len(self.files):
-            name, _ = self.files[self.selected_index]
+        if self.names and 0 <= self.selected_index < len(self.names):
+            name = self.names[self.selected_index]
             if name == '..':
                 return os.path.dirname(self.current_path)
             return os.path.join(self.current_path, name)
@@ -4831,11 +5242,13 @@ class FileBrowser:
         # Draw files
         visible_count = self.height - 4
         start_idx = self.scroll_offset
-        end_idx = min(start_idx + visible_count, len(self.files))
+        end_idx = min(start_idx + visible_count, len(self.names))
+        row_width = self.width - 2
+        reset = Color.reset()
         
         for i in range(start_idx, end_idx):
-            name, is_dir = self.files[i]
-            display_name = name
+            is_dir = self.is_dir[i]
+            display_name = self.names[i]
             
             # Truncate if needed
             max_name_len = self.width - 6
@@ -4852,35 +5265,28 @@ class FileBrowser:
             is_selected = (i == self.selected_index)
             
             if is_selected:
-                output.append(Cursor.move(self.x + 1, y_pos))
-                output.append(Color.bg_rgb(80, 120, 180))
-                output.append(Color.rgb(255, 255, 255))
-                output.append(f" {display_name:<{self.width-2}} ")
-                output.append(Color.reset())
+                output.append(
+                    f"{Cursor.move(self.x + 1, y_pos)}{self._SELECTED_STYLE}"
+                    f" {display_name:<{row_width}} {reset}"
+                )
             else:
-                output.append(Cursor.move(self.x + 2, y_pos))
-                if is_dir:
-                    output.append(Color.rgb(100, 180, 255))
-                else:
-                    output.append(Color.rgb(200, 210, 230))
-                output.append(display_name)
+                style = self._DIR_STYLE if is_dir else self._FILE_STYLE
+                output.append(f"{Cursor.move(self.x + 2, y_pos)}{style}{display_name}")
         
         # Draw scrollbar if needed
-        if len(self.files) > visible_count:
+        if len(self.names) > visible_count:
             scrollbar_height = self.height - 4
-            thumb_size = max(1, int(scrollbar_height * visible_count / len(self.files)))
-            thumb_pos = int(scrollbar_height * self.scroll_offset / len(self.files))
+            thumb_size = max(1, int(scrollbar_height * visible_count / len(self.names)))
+            thumb_pos = int(scrollbar_height * self.scroll_offset / len(self.names))
+            thumb_end = thumb_pos + thumb_size
+            bar_x = self.x + self.width - 2
+            top = self.y + 2
+            thumb, track = self._SCROLL_THUMB, self._SCROLL_TRACK
             
-            for i in range(scrollbar_height):
-                y_pos = self.y + 2 + i
-                output.append(Cursor.move(self.x + self.width - 2, y_pos))
-                
-                if thumb_pos <= i < thumb_pos + thumb_size:
-                    output.append(Color.rgb(100, 150, 200))
-                    output.append('█')
-                else:
-                    output.append(Color.rgb(60, 70, 90))
-                    output.append('░')
+            output.append(''.join([
+                Cursor.move(bar_x, top + i) + (thumb if thumb_pos <= i < thumb_end else track)
+                for i in range(scrollbar_height)
+            ]))
         
         output.append(Color.reset())
         return output
@@ -4892,12 +5298,22 @@ class FileBrowser:
 class TextEditor:
     """Simple text editor component"""
     
+    _LINENO_STYLE = Color.rgb(100, 120, 150)
+    _CONTENT_STYLE = Color.rgb(220, 220, 230)
+    
     def __init__(self, width: int, height: int, x: int, y: int):
         self.width = width
         self.height = height
         self.x = x
         self.y = y
-        self.lines: List[str] = [""]
+        # Gap buffer for the line being edited: characters before the cursor,
+        # and characters after it in reverse order, so edits at the cursor are
+        # list appends/pops instead of rebuilding the line string
+        self._gap_line: Optional[int] = None
+        self._gap_before: List[str] = []
+        self._gap_after: List[str] = []
+        self._gap_dirty = False
+        self._lines: List[str] = [""]
         self.cursor_x = 0
         self.cursor_y = 0
         self.scroll_x = 0
@@ -4906,15 +5322,53 @@ class TextEditor:
         self.modified = False
         self.filename: Optional[str] = None
     
+    @property
+    def lines(self) -> List[str]:
+        """Buffer lines, with any pending gap buffer edits written back"""
+        self._sync_gap()
+        return self._lines
+    
+    @lines.setter
+    def lines(self, lines: List[str]):
+        self._lines = lines
+        self._gap_line = None
+        self._gap_dirty = False
+    
+    def _sync_gap(self):
+        """Write the gap buffer contents back to its line"""
+        if self._gap_dirty:
+            self._lines[self._gap_line] = ''.join(self._gap_before) + ''.join(reversed(self._gap_after))
+            self._gap_dirty = False
+    
+    def _close_gap(self):
+        """Flush and release the gap buffer before structural line changes"""
+        self._sync_gap()
+        self._gap_line = None
+    
+    def _open_gap(self):
+        """Place the gap buffer at the cursor position"""
+        before = self._gap_before
+        after = self._gap_after
+        
+        if self._gap_line != self.cursor_y:
+            self._close_gap()
+            line = self._lines[self.cursor_y]
+            before[:] = line[:self.cursor_x]
+            after[:] = line[self.cursor_x:][::-1]
+            self._gap_line = self.cursor_y
+            return
+        
+        # Shift the gap within the line to follow the cursor
+        while len(before) > self.cursor_x:
+            after.append(before.pop())
+        while len(before) < self.cursor_x and after:
+            before.append(after.pop())
+    
     def load_file(self, filename: str):
         """Load a file"""
         try:
             with open(filename, 'r') as f:
-                self.lines = f.readlines()
-                # Remove newlines
-                self.lines = [line.rstrip('\n') for line in self.lines]
-                if not self.lines:
-                    self.lines = [""]
+                self.lines = f.read().splitlines() or [""]
             self.filename = filename
             self.modified = False
             self.cursor_x = 0
@@ -4942,23 +5396,27 @@ class TextEditor:
     
     def insert_char(self, char: str):
         """Insert character at cursor"""
-        if not self.lines:
+        if not self._lines:
             self.lines = [""]
         
-        line = self.lines[self.cursor_y]
-        self.lines[self.cursor_y] = line[:self.cursor_x] + char + line[self.cursor_x:]
+        self._open_gap()
+        self._gap_before.extend(char)
+        self._gap_dirty = True
         self.cursor_x += 1
         self.modified = True
     
     def delete_char(self):
         """Delete character before cursor"""
         if self.cursor_x > 0:
-            line = self.lines[self.cursor_y]
-            self.lines[self.cursor_y] = line[:self.cursor_x-1] + line[self.cursor_x:]
+            self._open_gap()
+            if len(self._gap_before) == self.cursor_x:
+                self._gap_before.pop()
+                self._gap_dirty = True
             self.cursor_x -= 1
             self.modified = True
         elif self.cursor_y > 0:
             # Join with previous line
+            self._close_gap()
             current_line = self.lines[self.cursor_y]
             previous_line = self.lines[self.cursor_y - 1]
             self.cursor_x = len(previous_line)
@@ -4969,6 +5427,7 @@ class TextEditor:
     
     def insert_newline(self):
         """Insert newline at cursor"""
+        self._close_gap()
         line = self.lines[self.cursor_y]
         self.lines[self.cursor_y] = line[:self.cursor_x]
         self.lines.insert(self.cursor_y + 1, line[self.cursor_x:])
@@ -4978,8 +5437,16 @@ class TextEditor:
     
     def move_cursor(self, dx: int, dy: int):
         """Move cursor"""
-        self.cursor_y = clamp(self.cursor_y + dy, 0, len(self.lines) - 1)
-        self.cursor_x = clamp(self.cursor_x + dx, 0, len(self.lines[self.cursor_y]))
+        lines = self._lines
+        line_count = len(lines)
+        self.cursor_y = clamp(self.cursor_y + dy, 0, line_count - 1)
+        
+        # Measure the line held in the gap buffer without writing it back
+        if self.cursor_y == self._gap_line:
+            line_len = len(self._gap_before) + len(self._gap_after)
+        else:
+            line_len = len(lines[self.cursor_y])
+        self.cursor_x = clamp(self.cursor_x + dx, 0, line_len)
         
         # Adjust scroll
         visible_lines = self.height - 4
@@ -5017,24 +5484,23 @@ class TextEditor:
         output.append(Color.reset())
         
         # Draw lines
+        lines = self.lines
+        line_count = len(lines)
         visible_lines = self.height - 4
         start_line = self.scroll_y
-        end_line = min(start_line + visible_lines, len(self.lines))
+        end_line = min(start_line + visible_lines, line_count)
+        col_start = self.scroll_x
+        col_end = self.scroll_x + self.width - 10
         
         for i in range(start_line, end_line):
-            line = self.lines[i]
-            display_line = line[self.scroll_x:self.scroll_x + self.width - 10]
-            
+            display_line = lines[i][col_start:col_end]
             y_pos = self.y + 2 + (i - start_line)
             
-            # Line number
-            output.append(Cursor.move(self.x + 2, y_pos))
-            output.append(Color.rgb(100, 120, 150))
-            output.append(f"{i+1:4d} ")
-            
-            # Line content
-            output.append(Color.rgb(220, 220, 230))
-            output.append(display_line)
+            # Line number and content
+            output.append(
+                f"{Cursor.move(self.x + 2, y_pos)}{self._LINENO_STYLE}{i+1:4d} "
+                f"{self._CONTENT_STYLE}{display_line}"
+            )
         
         # Draw cursor
         if start_line <= self.cursor_y < end_line:
@@ -5047,14 +5513,14 @@ class TextEditor:
                 output.append(Color.reverse())
                 
                 # Get character at cursor
-                line = self.lines[self.cursor_y]
+                line = lines[self.cursor_y]
                 char = line[self.cursor_x] if self.cursor_x < len(line) else ' '
                 output.append(char)
                 output.append(Color.reset())
         
         # Status bar
         status_y = self.y + self.height - 1
-        status = f" Line {self.cursor_y + 1}/{len(self.lines)} Col {self.cursor_x + 1} "
+        status = f" Line {self.cursor_y + 1}/{line_count} Col {self.cursor_x + 1} "
         output.append(Cursor.move(self.x + self.width - len(status) - 1, status_y))
         output.append(Color.rgb(180, 190, 200))
         output.append(status)
@@ -5069,6 +5535,9 @@ class TextEditor:
 class ChartRenderer:
     """Renders various types of charts"""
     
+    _LABEL_STYLE = Color.rgb(200, 200, 220)
+    _VALUE_STYLE = Color.reset() + Color.rgb(255, 255, 255)
+    
     @staticmethod
     def render_bar_chart(data: List[Tuple[str, float]], width: int, height: int,
                         x: int, y: int, title: str = "") -> List[str]:
@@ -5099,11 +5568,6 @@ class ChartRenderer:
         current_y = y
         
         for label, value in data:
-            # Label
-            output.append(Cursor.move(x, current_y))
-            output.append(Color.rgb(200, 200, 220))
-            output.append(f"{label[:15]:<15} ")
-            
             # Bar
             bar_width = int((width - 20) * value / max_value)
             bar_width = max(0, min(bar_width, width - 20))
@@ -5112,13 +5576,12 @@ class ChartRenderer:
             t = value / max_value
             color = Color.gradient((100, 100, 255), (255, 100, 100), t)
             
-            output.append(Color.rgb(*color))
-            output.append('█' * bar_width)
-            
-            # Value
-            output.append(Color.reset())
-            output.append(Color.rgb(255, 255, 255))
-            output.append(f" {value:.1f}")
+            # Label, bar and value
+            output.append(
+                f"{Cursor.move(x, current_y)}{ChartRenderer._LABEL_STYLE}{label[:15]:<15} "
+                f"{Color.rgb(*color)}{'█' * bar_width}"
+                f"{ChartRenderer._VALUE_STYLE} {value:.1f}"
+            )
             
             current_y += bar_height
         
@@ -5144,19 +5607,8 @@ class ChartRenderer:
             y += 2
             height -= 2
         
-        # Normalize data
-        min_val = min(data)
-        max_val = max(data)
-        value_range = max_val - min_val
-        if value_range == 0:
-            value_range = 1
-        
         # Calculate point positions
-        points = []
-        for i, value in enumerate(data):
-            px = x + int((width - 1) * i / (len(data) - 1))
-            py = y + height - 1 - int((height - 1) * (value - min_val) / value_range)
-            points.append((px, py))
+        points = ChartRenderer._graph_points(data, width, height, x, y)
         
         # Draw axes
         for i in range(height):
@@ -5173,31 +5625,60 @@ class ChartRenderer:
             x1, y1 = points[i]
             x2, y2 = points[i + 1]
             
-            # Simple line drawing
-            steps = max(abs(x2 - x1), abs(y2 - y1))
-            if steps == 0:
-                steps = 1
+            # Bresenham's line algorithm: integer steps, each cell once
+            dx = abs(x2 - x1)
+            dy = abs(y2 - y1)
+            sx = 1 if x1 < x2 else -1
+            sy = 1 if y1 < y2 else -1
+            err = dx - dy
             
-            for step in range(steps + 1):
-                t = step / steps
-                px = int(x1 + (x2 - x1) * t)
-                py = int(y1 + (y2 - y1) * t)
-                
+            px, py = x1, y1
+            
+            # Color gradient, constant across the segment
+            seg_dot = Color.rgb(*Color.gradient((100, 200, 255), (255, 100, 200), i / len(points))) + '●'
+            
+            while True:
                 output.append(Cursor.move(px, py))
+                output.append(seg_dot)
+                
+                if px == x2 and py == y2:
+                    break
                 
-                # Color gradient
-                color = Color.gradient((100, 200, 255), (255, 100, 200), i / len(points))
-                output.append(Color.rgb(*color))
-                output.append('●')
+                e2 = 2 * err
+                if e2 > -dy:
+                    err -= dy
+                    px += sx
+                if e2 < dx:
+                    err += dx
+                    py += sy
         
         # Draw points
+        point_dot = Color.rgb(255, 255, 100) + '●'
         for px, py in points:
             output.append(Cursor.move(px, py))
-            output.append(Color.rgb(255, 255, 100))
-            output.append('●')
+            output.append(point_dot)
         
         output.append(Color.reset())
         return output
+    
+    @staticmethod
+    def _graph_points(data: List[float], width: int, height: int,
+                      x: int, y: int) -> List[Tuple[int, int]]:
+        """Map data values to normalized screen cells"""
+        min_val = min(data)
+        value_range = max(data) - min_val
+        if value_range == 0:
+            value_range = 1
+        
+        x_span = width - 1
+        y_span = height - 1
+        last = len(data) - 1
+        bottom = y + height - 1
+        
+        return [
+            (x + int(x_span * i / last), bottom - int(y_span * (value - min_val) / value_range))
+            for i, value in enumerate(data)
+        ]
 
 # ============================================================================
 # SYNTAX HIGHLIGHTER
@@ -5226,37 +5707,43 @@ class SyntaxHighlighter:
             'function': (100, 200, 255),
             'operator': (255, 150, 100),
         }
+        
+        # One token scanner per language; the matched group names the token kind
+        self._token_re = {
+            lang: self._compile_tokens(words) for lang, words in self.keywords.items()
+        }
+        self._color_cache = {kind: Color.rgb(*rgb) for kind, rgb in self.colors.items()}
+    
+    @staticmethod
+    def _compile_tokens(words: List[str]) -> re.Pattern:
+        """Build the token scanner for a keyword list"""
+        pattern = r'(?P<string>["\'])\S*|(?P<comment>#)\S*|(?P<word>\S+)'
+        if words:
+            alternatives = '|'.join(map(re.escape, sorted(words, key=len, reverse=True)))
+            pattern = r'(?P<keyword>%s)(?!\S)|%s' % (alternatives, pattern)
+        return re.compile(pattern)
     
     def highlight_line(self, line: str, language: str = 'python') -> str:
         """Highlight a single line of code"""
-        if language not in self.keywords:
+        token_re = self._token_re.get(language)
+        if token_re is None:
             return line
         
         # This is a simplified highlighter
+        colors = self._color_cache
+        reset = Color.reset()
         output = []
-        words = line.split()
         
-        for word in words:
-            if word in self.keywords[language]:
-                output.append(Color.rgb(*self.colors['keyword']))
-                output.append(word)
-                output.append(Color.reset())
-            elif word.startswith('"') or word.startswith("'"):
-                output.append(Color.rgb(*self.colors['string']))
-                output.append(word)
-                output.append(Color.reset())
-            elif word.startswith('#'):
-                output.append(Color.rgb(*self.colors['comment']))
-                output.append(word)
-                output.append(Color.reset())
-            elif word.isdigit():
-                output.append(Color.rgb(*self.colors['number']))
-                output.append(word)
-                output.append(Color.reset())
+        for match in token_re.finditer(line):
+            word = match.group()
+            kind = match.lastgroup
+            if kind == 'word':
+                # str.isdigit, not \d, so superscripts count as numbers too
+                kind = 'number' if word.isdigit() else None
+            if kind:
+                output.append(f"{colors[kind]}{word}{reset} ")
             else:
-                output.append(word)
-            
-            output.append(' ')
+                output.append(word + ' ')
         
         return ''.join(output)
 
@@ -5267,6 +5754,25 @@ class SyntaxHighlighter:
 class MarkdownRenderer:
     """Render markdown-like text with formatting"""
     
+    # Inline markup: bold, italic, code, link; the matched group selects the style
+    _INLINE_RE = re.compile(
+        r'\*\*([^\*]+)\*\*|\*([^\*]+)\*|`([^`]+)`|\[([^\]]+)\]\([^\)]+\)'
+    )
+    _INLINE_STYLES = (
+        None,
+        Color.bold(),
+        Color.italic(),
+        Color.bg_rgb(40, 45, 50) + Color.rgb(200, 255, 200),
+        Color.rgb(100, 180, 255) + Color.underline(),
+    )
+    
+    # Header prefixes with their styles, longest first
+    _HEADER_STYLES = (
+        ('### ', Color.rgb(180, 200, 255) + Color.bold()),
+        ('## ', Color.rgb(200, 180, 255) + Color.bold()),
+        ('# ', Color.rgb(255, 200, 100) + Color.bold()),
+    )
+    
     def __init__(self):
         self.in_code_block = False
         self.code_block_lines: List[str] = []
@@ -5290,27 +5796,18 @@ class MarkdownRenderer:
         output.append(Cursor.move(x, y))
         
         # Headers
-        if line.startswith('# '):
-            output.append(Color.rgb(255, 200, 100))
-            output.append(Color.bold())
-            output.append(line[2:])
-            output.append(Color.reset())
-            return output
-        elif line.startswith('## '):
-            output.append(Color.rgb(200, 180, 255))
-            output.append(Color.bold())
-            output.append(line[3:])
-            output.append(Color.reset())
-            return output
-        elif line.startswith('### '):
-            output.append(Color.rgb(180, 200, 255))
-            output.append(Color.bold())
-            output.append(line[4:])
-            output.append(Color.reset())
-            return output
+        if line[:1] == '#':
+            for prefix, style in self._HEADER_STYLES:
+                if line.startswith(prefix):
+                    output.append(style)
+                    output.append(line[len(prefix):])
+                    output.append(Color.reset())
+                    return output
+        
+        stripped = line.strip()
         
         # Code blocks
-        if line.strip() == '```':
+        if stripped == '```':
             self.in_code_block = not self.in_code_block
             return output
         
@@ -5322,14 +5819,14 @@ class MarkdownRenderer:
             return output
         
         # Lists
-        if line.strip().startswith('- ') or line.strip().startswith('* '):
+        if stripped[:2] in ('- ', '* '):
             indent = len(line) - len(line.lstrip())
             output.append(' ' * indent)
             output.append(Color.rgb(255, 200, 100))
             output.append('• ')
             output.append(Color.reset())
             output.append(Color.rgb(220, 220, 230))
-            output.append(line.strip()[2:])
+            output.append(stripped[2:])
             output.append(Color.reset())
             return output
         
@@ -5342,37 +5839,23 @@ class MarkdownRenderer:
     
     def _format_inline(self, text: str) -> str:
         """Format inline markdown (bold, italic, code)"""
-        result = text
-        
-        # Bold (**text**)
-        result = re.sub(
-            r'\*\*([^\*]+)\*\*',
-            lambda m: Color.bold() + m.group(1) + Color.reset(),
-            result
-        )
-        
-        # Italic (*text*)
-        result = re.sub(
-            r'\*([^\*]+)\*',
-            lambda m: Color.italic() + m.group(1) + Color.reset(),
-            result
-        )
-        
-        # Inline code (`code`)
-        result = re.sub(
-            r'`([^`]+)`',
-            lambda m: Color.bg_rgb(40, 45, 50) + Color.rgb(200, 255, 200) + m.group(1) + Color.reset(),
-            result
-        )
-        
-        # Links [text](url)
-        result = re.sub(
-            r'\[([^\]]+)\]\(([^\)]+)\)',
-            lambda m: Color.rgb(100, 180, 255) + Color.underline() + m.group(1) + Color.reset(),
-            result
-        )
-        
-        return result
+        styles = self._INLINE_STYLES
+        reset = Color.reset()
+        parts = []
+        pos = 0
+        
+        for match in self._INLINE_RE.finditer(text):
+            kind = match.lastindex
+            parts.append(text[pos:match.start()])
+            parts.append(styles[kind])
+            parts.append(match.group(kind))
+            parts.append(reset)
+            pos = match.end()
+        
+        if not pos:
+            return text
+        parts.append(text[pos:])
+        return ''.join(parts)
 
 # ============================================================================
 # MORE BUILT-IN PLUGINS
@@ -5381,13 +5864,115 @@ class MarkdownRenderer:
 class GitPlugin(Plugin):
     """Git integration plugin"""
     
+    # Runs 'git status' off the render thread
+    _status_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="git-status")
+    
+    _BRANCH_LABEL = Color.rgb(150, 200, 255) + "⎇  " + Color.rgb(255, 255, 255)
+    _CHANGES_MARK = " " + Color.rgb(255, 200, 100) + "●"
+    
     def __init__(self):
         super().__init__("git", "1.0")
+        # Git directory resolved for a working directory: (cwd, git_dir)
+        self._git_dir_cache: Tuple[str, Optional[str]] = ("", None)
+        # Branch read from HEAD: (HEAD path, HEAD mtime_ns, branch)
+        self._head_mtime_cache: Tuple[str, int, str] = ("", 0, "")
         self.current_branch = self._get_current_branch()
         self.has_changes = False
+        # 'git status' runs at most once per TTL unless the index changes
+        self._changes_checked_at = 0.0
+        self._changes_ttl = 2.0
+        # The TTL doubles up to _changes_max_ttl while checks find nothing new
+        self._changes_max_ttl = 30.0
+        self._changes_backoff_ttl = self._changes_ttl
+        self._index_mtime = 0
+        self._changes_future: Optional[Future] = None
+    
+    def _find_git_dir(self) -> Optional[str]:
+        """Locate the git directory for the current working directory"""
+        cwd = os.getcwd()
+        if self._git_dir_cache[0] == cwd:
+            return self._git_dir_cache[1]
+        
+        git_dir = None
+        path = cwd
+        while True:
+            candidate = os.path.join(path, '.git')
+            if os.path.isdir(candidate):
+                git_dir = candidate
+                break
+            if os.path.isfile(candidate):
+                # Worktrees and submodules use a '.git' file pointing at the git dir
+                try:
+                    with open(candidate, 'r') as f:
+                        content = f.read().strip()
+                    if content.startswith('gitdir: '):
+                        git_dir = os.path.join(path, content[8:])
+                except OSError:
+                    pass
+                break
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        
+        self._git_dir_cache = (cwd, git_dir)
+        return git_dir
     
     def _get_current_branch(self) -> str:
         """Get current git branch"""
+        git_dir = self._find_git_dir()
+        if git_dir is None:
+            return ""
+        
+        # HEAD only changes on checkout, so re-read it only when its mtime moves
+        head = os.path.join(git_dir, 'HEAD')
+        try:
+            mtime = os.stat(head).st_mtime_ns
+        except OSError:
+            return ""
+        cached_head, cached_mtime, cached_branch = self._head_mtime_cache
+        if cached_head == head and cached_mtime == mtime:
+            return cached_branch
+        
+        try:
+            with open(head, 'rb') as f:
+                content = f.read().strip()
+        except OSError:
+            return ""
+        
+        if content.startswith(b'ref: refs/heads/'):
+            branch = content[16:].decode('utf-8', 'replace')
+        elif content.startswith(b'ref: '):
+            branch = self._follow_symbolic_ref(git_dir, content[5:])
+            if branch is None:
+                branch = self._run_branch_command()
+        else:
+            # Detached HEAD has no current branch
+            branch = ""
+        
+        self._head_mtime_cache = (head, mtime, branch)
+        return branch
+    
+    def _follow_symbolic_ref(self, git_dir: str, ref: bytes) -> Optional[str]:
+        """Resolve a symbolic ref chain from loose ref files; None if git must decide"""
+        for _ in range(5):
+            try:
+                with open(os.path.join(git_dir, os.fsdecode(ref)), 'rb') as f:
+                    content = f.read().strip()
+            except OSError:
+                if ref.startswith(b'refs/heads/'):
+                    # Packed or unborn branch
+                    return ref[11:].decode('utf-8', 'replace')
+                # Could live in a worktree's common dir
+                return None
+            if not content.startswith(b'ref: '):
+                # The chain ends at a commit id
+                return ref[11:].decode('utf-8', 'replace') if ref.startswith(b'refs/heads/') else ""
+            ref = content[5:]
+        return None
+    
+    def _run_branch_command(self) -> str:
+        """Ask git for the current branch"""
         try:
             result = subprocess.run(
                 ['git', 'branch', '--show-current'],
@@ -5401,13 +5986,29 @@ class GitPlugin(Plugin):
             pass
         return ""
     
+    def _get_index_mtime(self) -> int:
+        """mtime_ns of the git index, or 0 if there is none"""
+        git_dir = self._find_git_dir()
+        if git_dir is None:
+            return 0
+        try:
+            return os.stat(os.path.join(git_dir, 'index')).st_mtime_ns
+        except OSError:
+            return 0
+    
+    def _check_changes_and_index(self) -> Tuple[bool, int]:
+        """Check for changes, then read the index mtime git status may have refreshed"""
+        return self._check_changes(), self._get_index_mtime()
+    
     def _check_changes(self) -> bool:
         """Check if there are uncommitted changes"""
+        if self._find_git_dir() is None:
+            return False
         try:
+            # Only emptiness matters, so the output stays undecoded bytes
             result = subprocess.run(
                 ['git', 'status', '--porcelain'],
                 capture_output=True,
-                text=True,
                 timeout=1
             )
             if result.returncode == 0:
@@ -5418,32 +6019,48 @@ class GitPlugin(Plugin):
     
     def on_render(self, context: Dict[str, Any]) -> List[str]:
         """Render git status"""
-        if not self.current_branch:
+        # Nothing to show (or poll) outside a repository; the lookup is cached per cwd
+        if not self.current_branch or self._find_git_dir() is None:
             return []
         
-        output = []
         width = context.get('width', 80)
         height = context.get('height', 24)
         
-        # Update status
-        self.has_changes = self._check_changes()
+        # Pick up a finished background status check
+        future = self._changes_future
+        if future is not None and future.done():
+            has_changes, index_mtime = future.result()
+            if has_changes == self.has_changes and index_mtime == self._index_mtime:
+                self._changes_backoff_ttl = min(self._changes_backoff_ttl * 2, self._changes_max_ttl)
+            else:
+                self._changes_backoff_ttl = self._changes_ttl
+            self.has_changes = has_changes
+            # Taken after 'git status' so its own index refresh doesn't retrigger it
+            self._index_mtime = index_mtime
+            self._changes_future = None
+        
+        # Start a new check when the index changed or the last one expired
+        now = time.time()
+        index_mtime = self._get_index_mtime()
+        expired = now - self._changes_checked_at > self.poll_interval(self._changes_backoff_ttl)
+        due = expired or (self.visible and index_mtime != self._index_mtime)
+        if due and self._changes_future is None:
+            self._changes_future = self._status_pool.submit(self._check_changes_and_index)
+            self._changes_checked_at = now
         
         # Position in top-left corner
         x = 5
         y = 2
         
+        output = []
         output.append(Cursor.move(x, y))
-        output.append(Color.rgb(150, 200, 255))
-        output.append("⎇  ")
-        output.append(Color.rgb(255, 255, 255))
+        output.append(self._BRANCH_LABEL)
         output.append(self.current_branch)
         
         if self.has_changes:
-            output.append(" ")
-            output.append(Color.rgb(255, 200, 100))
-            output.append("●")
+            output.append(self._CHANGES_MARK)
         
-        output.append(Color.reset())
+        output.append(self._RESET)
         
         return output
     
@@ -5451,16 +6068,18 @@ class GitPlugin(Plugin):
         """Handle git commands"""
         if command.startswith("git "):
             try:
+                # Run git directly rather than through an intermediate /bin/sh
                 result = subprocess.run(
-                    command,
-                    shell=True,
+                    shlex.split(command),
                     capture_output=True,
                     text=True,
                     timeout=10
                 )
                 
-                # Update branch info
+                # Update branch info and recheck changes on the next render
                 self.current_branch = self._get_current_branch()
+                self._changes_checked_at = 0.0
+                self._changes_backoff_ttl = self._changes_ttl
                 
                 output = ""
                 if result.stdout:
@@ -5484,29 +6103,46 @@ class NetworkMonitorPlugin(Plugin):
         self.last_check = 0.0
         self.interfaces: Dict[str, Dict[str, int]] = {}
         self.update_interval = 2.0
+        # /proc/net/dev stays open; each poll re-reads it from offset 0
+        self._net_dev_fd: Optional[int] = None
+    
+    def on_unload(self):
+        """Close the /proc/net/dev descriptor"""
+        if self._net_dev_fd is not None:
+            os.close(self._net_dev_fd)
+            self._net_dev_fd = None
     
     def _get_network_stats(self) -> Dict[str, Dict[str, int]]:
         """Get network statistics"""
         stats = {}
         
         try:
-            # Read /proc/net/dev
-            with open('/proc/net/dev', 'r') as f:
-                lines = f.readlines()[2:]  # Skip headers
+            if self._net_dev_fd is None:
+                self._net_dev_fd = os.open('/proc/net/dev', os.O_RDONLY)
+            
+            # One line per interface, so the file can outgrow a single read
+            chunks = []
+            offset = 0
+            while True:
+                chunk = os.pread(self._net_dev_fd, 4096, offset)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                offset += len(chunk)
+            
+            for line in b''.join(chunks).split(b'\n')[2:]:  # Skip headers
+                parts = line.split(b':')
+                if len(parts) != 2:
+                    continue
                 
-                for line in lines:
-                    parts = line.split(':')
-                    if len(parts) != 2:
-                        continue
-                    
-                    interface = parts[0].strip()
-                    values = parts[1].split()
-                    
-                    if len(values) >= 9:
-                        stats[interface] = {
-                            'rx_bytes': int(values[0]),
-                            'tx_bytes': int(values[8])
-                        }
+                interface = parts[0].strip().decode('utf-8', 'replace')
+                values = parts[1].split()
+                
+                if len(values) >= 9:
+                    stats[interface] = {
+                        'rx_bytes': int(values[0]),
+                        'tx_bytes': int(values[8])
+                    }
         except:
             pass
         
@@ -5533,38 +6169,78 @@ class NetworkMonitorPlugin(Plugin):
 class CPUMonitorPlugin(Plugin):
     """CPU monitoring plugin"""
     
+    _LABEL = Color.rgb(200, 150, 255) + "CPU: "
+    # Usage styles for < 50%, < 80% and above
+    _LOW_STYLE = Color.rgb(100, 255, 150) + Color.bold()
+    _MID_STYLE = Color.rgb(255, 200, 100) + Color.bold()
+    _HIGH_STYLE = Color.rgb(255, 100, 100) + Color.bold()
+    # Mini-graph glyphs by bar height 0..3
+    _GRAPH_GLYPHS = '░▒▓█'
+    
     def __init__(self):
         super().__init__("cpumon", "1.0")
         self.position = (0.5, 0.05)
         self.history: deque = deque(maxlen=50)
+        # Graph cell (color + glyph) for each history sample, built on append
+        self._graph_cells: deque = deque(maxlen=50)
+        # Graph colors for each whole usage percent 0..100
+        self._usage_palette = [
+            Color.rgb(*color)
+            for color in generate_gradient_palette((100, 255, 150), (255, 100, 100), 101)
+        ]
         self.last_update = 0.0
         self.update_interval = 1.0
+        # /proc/stat stays open; each sample re-reads it from offset 0.
+        # _fd_lock keeps unload from closing it under a running sample
+        self._stat_fd: Optional[int] = None
+        self._fd_lock = threading.Lock()
+        self._closed = False
+    
+    def on_load(self):
+        """Allow sampling again after an unload"""
+        with self._fd_lock:
+            self._closed = False
+    
+    def on_unload(self):
+        """Close the /proc/stat descriptor"""
+        self._cancel_sample()
+        with self._fd_lock:
+            self._closed = True
+            if self._stat_fd is not None:
+                os.close(self._stat_fd)
+                self._stat_fd = None
     
     def _get_cpu_usage(self) -> float:
         """Get CPU usage percentage"""
         try:
-            with open('/proc/stat', 'r') as f:
-                line = f.readline()
-                values = [int(x) for x in line.split()[1:]]
+            with self._fd_lock:
+                if self._closed:
+                    return 0.0
+                if self._stat_fd is None:
+                    self._stat_fd = os.open('/proc/stat', os.O_RDONLY)
                 
-                total = sum(values)
-                idle = values[3]
+                # The aggregate 'cpu' line comes first and fits in one small read
+                buf = os.pread(self._stat_fd, 512, 0)
+            values = [int(x) for x in buf[:buf.index(b'\n')].split()[1:]]
+            
+            total = sum(values)
+            idle = values[3]
+            
+            if hasattr(self, '_last_total'):
+                total_diff = total - self._last_total
+                idle_diff = idle - self._last_idle
                 
-                if hasattr(self, '_last_total'):
-                    total_diff = total - self._last_total
-                    idle_diff = idle - self._last_idle
-                    
-                    if total_diff > 0:
-                        usage = 100 * (total_diff - idle_diff) / total_diff
-                    else:
-                        usage = 0
+                if total_diff > 0:
+                    usage = 100 * (total_diff - idle_diff) / total_diff
                 else:
                     usage = 0
-                
-                self._last_total = total
-                self._last_idle = idle
-                
-                return usage
+            else:
+                usage = 0
+            
+            self._last_total = total
+            self._last_idle = idle
+            
+            return usage
         except:
             return 0.0
     
@@ -5572,16 +6248,18 @@ class CPUMonitorPlugin(Plugin):
         """Render CPU monitor"""
         current_time = context.get('time', 0)
         
-        # Update if needed
-        if current_time - self.last_update >= self.update_interval:
-            usage = self._get_cpu_usage()
-            self.history.append(usage)
+        # Sample in the background; a finished sample shows up a frame later
+        due = current_time - self.last_update >= self.poll_interval(self.update_interval)
+        usage = self._poll_sample(self._get_cpu_usage, due)
+        if due:
             self.last_update = current_time
+        if usage is not None:
+            self.history.append(usage)
+            self._graph_cells.append(self._graph_cell(usage))
         
         if not self.history:
             return []
         
-        output = []
         width = context.get('width', 80)
         height = context.get('height', 24)
         
@@ -5591,48 +6269,37 @@ class CPUMonitorPlugin(Plugin):
         # Current usage
         current_usage = self.history[-1] if self.history else 0
         
+        output = []
         output.append(Cursor.move(x, y))
-        output.append(Color.rgb(200, 150, 255))
-        output.append("CPU: ")
+        output.append(self._LABEL)
         
         # Color based on usage
         if current_usage < 50:
-            color = (100, 255, 150)
+            output.append(self._LOW_STYLE)
         elif current_usage < 80:
-            color = (255, 200, 100)
+            output.append(self._MID_STYLE)
         else:
-            color = (255, 100, 100)
+            output.append(self._HIGH_STYLE)
         
-        output.append(Color.rgb(*color))
-        output.append(Color.bold())
         output.append(f"{current_usage:.1f}%")
-        output.append(Color.reset())
+        output.append(self._RESET)
         
         # Mini graph
         graph_width = 20
         if len(self.history) > 1:
             output.append(Cursor.move(x, y + 1))
-            
-            for i, usage in enumerate(list(self.history)[-graph_width:]):
-                bar_height = int(usage / 100 * 3)
-                
-                if bar_height >= 3:
-                    char = '█'
-                elif bar_height >= 2:
-                    char = '▓'
-                elif bar_height >= 1:
-                    char = '▒'
-                else:
-                    char = '░'
-                
-                t = usage / 100
-                color = Color.gradient((100, 255, 150), (255, 100, 100), t)
-                output.append(Color.rgb(*color))
-                output.append(char)
+            start = max(0, len(self._graph_cells) - graph_width)
+            output.extend(islice(self._graph_cells, start, None))
+        
+        output.append(self._RESET)
         
-        output.append(Color.reset())
         return output
     
+    def _graph_cell(self, usage: float) -> str:
+        """Colored mini-graph glyph for one usage sample"""
+        bar_height = min(max(int(usage / 100 * 3), 0), 3)
+        return self._usage_palette[min(max(int(usage), 0), 100)] + self._GRAPH_GLYPHS[bar_height]
+    
     def on_command(self, command: str) -> Optional[str]:
         """Handle CPU monitor commands"""
         if command.strip() == "cpu":
@@ -5649,32 +6316,62 @@ class CPUMonitorPlugin(Plugin):
 class MemoryMonitorPlugin(Plugin):
     """Memory monitoring plugin"""
     
+    _LABEL = Color.rgb(150, 200, 255) + "MEM: "
+    # Usage styles for < 50%, < 80% and above
+    _LOW_STYLE = Color.rgb(100, 255, 150) + Color.bold()
+    _MID_STYLE = Color.rgb(255, 200, 100) + Color.bold()
+    _HIGH_STYLE = Color.rgb(255, 100, 100) + Color.bold()
+    # MemTotal precedes MemAvailable in /proc/meminfo
+    _MEMINFO_RE = re.compile(rb'MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)', re.DOTALL)
+    
     def __init__(self):
         super().__init__("memmon", "1.0")
         self.position = (0.7, 0.05)
         self.last_update = 0.0
         self.update_interval = 2.0
         self.mem_usage = 0.0
+        # /proc/meminfo stays open; each sample re-reads it from offset 0.
+        # _fd_lock keeps unload from closing it under a running sample
+        self._meminfo_fd: Optional[int] = None
+        self._fd_lock = threading.Lock()
+        self._closed = False
+    
+    def on_load(self):
+        """Allow sampling again after an unload"""
+        with self._fd_lock:
+            self._closed = False
+    
+    def on_unload(self):
+        """Close the /proc/meminfo descriptor"""
+        self._cancel_sample()
+        with self._fd_lock:
+            self._closed = True
+            if self._meminfo_fd is not None:
+                os.close(self._meminfo_fd)
+                self._meminfo_fd = None
     
     def _get_memory_usage(self) -> Tuple[float, int, int]:
         """Get memory usage (percentage, used MB, total MB)"""
         try:
-            with open('/proc/meminfo', 'r') as f:
-                lines = f.readlines()
-                
-                mem_total = 0
-                mem_available = 0
+            with self._fd_lock:
+                if self._closed:
+                    return 0.0, 0, 0
+                if self._meminfo_fd is None:
+                    self._meminfo_fd = os.open('/proc/meminfo', os.O_RDONLY)
                 
-                for line in lines:
-                    if line.startswith('MemTotal:'):
-                        mem_total = int(line.split()[1])
-                    elif line.startswith('MemAvailable:'):
-                        mem_available = int(line.split()[1])
-                
-                if mem_total > 0:
-                    mem_used = mem_total - mem_available
-                    percentage = (mem_used / mem_total) * 100
-                    return percentage, mem_used // 1024, mem_total // 1024
+                # MemTotal and MemAvailable are among the first few lines
+                buf = os.pread(self._meminfo_fd, 512, 0)
+            match = self._MEMINFO_RE.search(buf)
+            if match is None:
+                return 0.0, 0, 0
+            
+            mem_total = int(match.group(1))
+            mem_available = int(match.group(2))
+            
+            if mem_total > 0:
+                mem_used = mem_total - mem_available
+                percentage = (mem_used / mem_total) * 100
+                return percentage, mem_used // 1024, mem_total // 1024
         except:
             pass
         
@@ -5684,36 +6381,37 @@ class MemoryMonitorPlugin(Plugin):
         """Render memory monitor"""
         current_time = context.get('time', 0)
         
-        # Update if needed
-        if current_time - self.last_update >= self.update_interval:
-            self.mem_usage, used_mb, total_mb = self._get_memory_usage()
+        # Sample in the background; a finished sample shows up a frame later
+        due = current_time - self.last_update >= self.poll_interval(self.update_interval)
+        sample = self._poll_sample(self._get_memory_usage, due)
+        if due:
             self.last_update = current_time
+        if sample is not None:
+            self.mem_usage = sample[0]
         
-        output = []
         width = context.get('width', 80)
         height = context.get('height', 24)
         
         x = int(width * self.position[0])
         y = int(height * self.position[1])
         
+        output = []
         output.append(Cursor.move(x, y))
-        output.append(Color.rgb(150, 200, 255))
-        output.append("MEM: ")
+        output.append(self._LABEL)
         
         # Color based on usage
         if self.mem_usage < 50:
-            color = (100, 255, 150)
+            output.append(self._LOW_STYLE)
         elif self.mem_usage < 80:
-            color = (255, 200, 100)
+            output.append(self._MID_STYLE)
         else:
-            color = (255, 100, 100)
+            output.append(self._HIGH_STYLE)
         
-        output.append(Color.rgb(*color))
-        output.append(Color.bold())
         output.append(f"{self.mem_usage:.1f}%")
-        output.append(Color.reset())
+        output.append(self._RESET)
+        
+        output.append(self._RESET)
         
-        output.append(Color.reset())
         return output
     
     def on_command(self, command: str) -> Optional[str]:
@@ -5751,16 +6449,18 @@ class TodoPlugin(Plugin):
             
             return "\n".join(lines)
         
-        action = parts[1].split()[0] if parts[1] else ""
+        args = parts[1].split()
+        action = args[0] if args else ""
         
-        if action == "add" and len(parts[1].split(maxsplit=1)) > 1:
+        if action == "add" and len(args) > 1:
+            # Keep the task text's own spacing
             task = parts[1].split(maxsplit=1)[1]
             self.todos.append((task, False))
             return f"Added TODO: {task}"
         
-        elif action == "done" and len(parts[1].split()) > 1:
+        elif action == "done" and len(args) > 1:
             try:
-                index = int(parts[1].split()[1]) - 1
+                index = int(args[1]) - 1
                 if 0 <= index < len(self.todos):
                     task, _ = self.todos[index]
                     self.todos[index] = (task, True)
@@ -5769,9 +6469,9 @@ class TodoPlugin(Plugin):
             except ValueError:
                 return "Invalid number"
         
-        elif action == "remove" and len(parts[1].split()) > 1:
+        elif action == "remove" and len(args) > 1:
             try:
-                index = int(parts[1].split()[1]) - 1
+                index = int(args[1]) - 1
                 if 0 <= index < len(self.todos):
                     task, _ = self.todos.pop(index)
                     return f"Removed TODO: {task}"
@@ -5789,6 +6489,8 @@ class TodoPlugin(Plugin):
 class TimerPlugin(Plugin):
     """Timer/stopwatch plugin"""
     
+    _LABEL = Color.rgb(255, 200, 100) + "⏱  " + Color.rgb(255, 255, 255) + Color.bold()
+    
     def __init__(self):
         super().__init__("timer", "1.0")
         self.start_time: Optional[float] = None
@@ -5835,9 +6537,8 @@ class TimerPlugin(Plugin):
     
     def _format_time(self, seconds: float) -> str:
         """Format seconds as HH:MM:SS"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(math.floor(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     
     def on_render(self, context: Dict[str, Any]) -> List[str]:
@@ -5845,7 +6546,6 @@ class TimerPlugin(Plugin):
         if not self.running and self.elapsed == 0:
             return []
         
-        output = []
         width = context.get('width', 80)
         height = context.get('height', 24)
         
@@ -5859,13 +6559,11 @@ class TimerPlugin(Plugin):
         
         time_str = self._format_time(elapsed)
         
+        output = []
         output.append(Cursor.move(x, y))
-        output.append(Color.rgb(255, 200, 100))
-        output.append("⏱  ")
-        output.append(Color.rgb(255, 255, 255))
-        output.append(Color.bold())
+        output.append(self._LABEL)
         output.append(time_str)
-        output.append(Color.reset())
+        output.append(self._RESET)
         
         return output
 
@@ -5873,13 +6571,15 @@ class TimerPlugin(Plugin):
 # UTILITY FUNCTIONS
 # ============================================================================
 
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_bytes(bytes_value: int) -> str:
     """Format bytes as human-readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.2f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.2f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it
+    unit = min((int(bytes_value).bit_length() - 1) // 10, 5)
+    return f"{bytes_value / (1 << (unit * 10)):.2f} {BYTE_UNITS[unit]}"
 
 def format_duration(seconds: float) -> str:
     """Format duration as human-readable string"""
@@ -5903,6 +6603,12 @@ def truncate_string(s: str, max_length: int, ellipsis: str = "...") -> str:
 
 def wrap_text(text: str, width: int) -> List[str]:
     """Wrap text to specified width"""
+    # Re-rendering unchanged text is the common case; callers get their own list
+    return list(_wrap_text(text, width))
+
+@functools.lru_cache(maxsize=256)
+def _wrap_text(text: str, width: int) -> Tuple[str, ...]:
+    """Wrap text into a cached tuple of lines"""
     words = text.split()
     lines = []
     current_line = []
@@ -5923,8 +6629,9 @@ def wrap_text(text: str, width: int) -> List[str]:
     if current_line:
         lines.append(' '.join(current_line))
     
-    return lines
+    return tuple(lines)
 
+@functools.lru_cache(maxsize=256)
 def parse_color(color_string: str) -> Optional[Tuple[int, int, int]]:
     """Parse color from string (hex or rgb format)"""
     color_string = color_string.strip()
@@ -5996,23 +6703,18 @@ def bezier_curve(points: List[Tuple[float, float]], t: float) -> Tuple[float, fl
     if n == 0:
         return points[0]
     
-    # De Casteljau's algorithm
-    temp_points = points.copy()
+    # De Casteljau's algorithm, reusing one pair of coordinate lists
+    # rather than building a new point list each round
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    s = 1 - t
     
-    for i in range(n):
-        new_points = []
-        for j in range(len(temp_points) - 1):
-            x1, y1 = temp_points[j]
-            x2, y2 = temp_points[j + 1]
-            
-            x = x1 * (1 - t) + x2 * t
-            y = y1 * (1 - t) + y2 * t
-            
-            new_points.append((x, y))
-        
-        temp_points = new_points
+    for i in range(n, 0, -1):
+        for j in range(i):
+            xs[j] = xs[j] * s + xs[j + 1] * t
+            ys[j] = ys[j] * s + ys[j + 1] * t
     
-    return temp_points[0]
+    return (xs[0], ys[0])
 
 def generate_gradient_palette(color1: Tuple[int, int, int], color2: Tuple[int, int, int], steps: int) -> List[Tuple[int, int, int]]:
     """Generate a gradient color palette"""
@@ -6027,6 +6729,12 @@ def generate_gradient_palette(color1: Tuple[int, int, int], color2: Tuple[int, i
 
 def create_rainbow_palette(steps: int) -> List[Tuple[int, int, int]]:
     """Create a rainbow color palette"""
+    # Callers get their own list; the cached tuple is never handed out
+    return list(_rainbow_palette(steps))
+
+@functools.lru_cache(maxsize=16)
+def _rainbow_palette(steps: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Build and cache the rainbow palette for a step count"""
     palette = []
     
     for i in range(steps):
@@ -6052,7 +6760,7 @@ def create_rainbow_palette(steps: int) -> List[Tuple[int, int, int]]:
         
         palette.append((int(r * 255), int(g * 255), int(b * 255)))
     
-    return palette
+    return tuple(palette)
 
 # ============================================================================
 # COMPREHENSIVE DOCUMENTATION AND EXAMPLES
@@ -6388,6 +7096,9 @@ Planned features:
 class DebugOverlay:
     """Debug information overlay"""
     
+    _HEADER_STYLE = Color.bg_rgb(20, 20, 30) + Color.rgb(200, 200, 220)
+    _ROW_STYLE = Color.bg_rgb(15, 15, 25) + Color.rgb(150, 180, 200)
+    
     def __init__(self):
         self.visible = False
         self.metrics: Dict[str, Any] = {}
@@ -6405,25 +7116,14 @@ class DebugOverlay:
         if not self.visible:
             return []
         
-        output = []
-        current_y = y
+        reset = Color.reset()
         
         # Background
-        output.append(Cursor.move(x, current_y))
-        output.append(Color.bg_rgb(20, 20, 30))
-        output.append(Color.rgb(200, 200, 220))
-        output.append(" DEBUG INFO ")
-        output.append(Color.reset())
-        current_y += 1
-        
-        # Metrics
-        for key, value in self.metrics.items():
-            output.append(Cursor.move(x, current_y))
-            output.append(Color.bg_rgb(15, 15, 25))
-            output.append(Color.rgb(150, 180, 200))
-            output.append(f" {key}: {value} ")
-            output.append(Color.reset())
-            current_y += 1
+        output = [f"{Cursor.move(x, y)}{self._HEADER_STYLE} DEBUG INFO {reset}"]
+        
+        # Metrics, one segment per row
+        for i, (key, value) in enumerate(self.metrics.items(), 1):
+            output.append(f"{Cursor.move(x, y + i)}{self._ROW_STYLE} {key}: {value} {reset}")
         
         return output
 
@@ -6436,20 +7136,38 @@ class ErrorHandler:
     
     def handle_error(self, error: Exception, context: str = ""):
         """Handle an error"""
+        message = str(error)
         error_info = {
             'timestamp': time.time(),
             'type': type(error).__name__,
-            'message': str(error),
+            'message': message,
             'context': context,
-            'traceback': traceback.format_exc()
+            # Formatted from '_trace' only when the error is read back
+            'traceback': '',
+            '_trace': self._capture_traceback(error)
         }
         
         self.errors.append(error_info)
-        self.logger.error(f"{context}: {str(error)}")
+        self.logger.error(f"{context}: {message}")
+    
+    def _capture_traceback(self, error: Exception) -> Optional[traceback.TracebackException]:
+        """Capture an exception's traceback without keeping its frames alive"""
+        if error.__traceback__ is None:
+            return None
+        # Source lines are looked up only when the traceback is formatted
+        return traceback.TracebackException(
+            type(error), error, error.__traceback__, lookup_lines=False
+        )
     
     def get_recent_errors(self, count: int = 10) -> List[Dict]:
         """Get recent errors"""
-        return list(self.errors)[-count:]
+        # Walk back from the newest entry so only `count` entries are touched
+        recent = list(islice(reversed(self.errors), max(count, 0)))[::-1]
+        for error_info in recent:
+            trace = error_info.pop('_trace', None)
+            if trace is not None:
+                error_info['traceback'] = ''.join(trace.format())
+        return recent
     
     def clear_errors(self):
         """Clear error history"""
@@ -6462,27 +7180,176 @@ class ErrorHandler:
 class DataStore:
     """Simple key-value data store with persistence"""
     
+    # Changes within this many seconds are written together
+    SAVE_DELAY = 0.25
+    # The change log is folded into the snapshot once it holds more than
+    # max(COMPACT_MIN_OPS, 2 * live keys) entries
+    COMPACT_MIN_OPS = 64
+    # Pending-change marker for deleted keys
+    _DELETED = object()
+    # Snapshot field counting rewrites; log lines carry the one they follow
+    _GENERATION_KEY = '_generation'
+    # Live stores, flushed at exit; weak so unused stores can still be freed
+    _instances: 'weakref.WeakSet[DataStore]' = weakref.WeakSet()
+    
     def __init__(self, filename: str = "~/.tui_data.json"):
         self.filename = os.path.expanduser(filename)
+        self.log_filename = self.filename + '.log'
         self.data: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        # Changes since the last write: key -> value or _DELETED
+        self._pending: Dict[str, Any] = {}
+        self._needs_snapshot = False
+        self._generation = 0
+        self._log_ops = 0
         self.load()
+        DataStore._instances.add(self)
     
     def load(self):
         """Load data from file"""
+        self._generation = 0
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r') as f:
-                    self.data = json.load(f)
+                # One binary read; both JSON backends accept bytes
+                with open(self.filename, 'rb') as f:
+                    snapshot = _json_loads(f.read())
+                if self._is_tagged_snapshot(snapshot):
+                    self._generation = snapshot[self._GENERATION_KEY]
+                    self.data = snapshot['data']
+                else:
+                    # A flat store from before snapshots were tagged
+                    self.data = snapshot
         except Exception:
             self.data = {}
+        
+        # Replay changes appended since the snapshot was written
+        self._log_ops = 0
+        try:
+            with open(self.log_filename, 'rb') as f:
+                lines = f.readlines()
+        except OSError:
+            lines = []
+        for line in lines:
+            self._log_ops += 1
+            if not line.endswith(b'\n'):
+                # The last write was cut short by a crash; appending after it
+                # would corrupt the next line, so rewrite the snapshot instead
+                self._needs_snapshot = True
+                break
+            try:
+                op = json.loads(line)
+            except ValueError:
+                # A damaged line; skip it and keep the ops after it
+                self._needs_snapshot = True
+                continue
+            if op.get('gen', 0) < self._generation:
+                # Left behind by a snapshot whose log removal failed
+                continue
+            if 'set' in op:
+                key, value = op['set']
+                self.data[key] = value
+            elif 'delete' in op:
+                self.data.pop(op['delete'], None)
+    
+    @classmethod
+    def _is_tagged_snapshot(cls, snapshot: Any) -> bool:
+        """Whether snapshot is {_generation: int, data: dict} rather than a flat store"""
+        if not isinstance(snapshot, dict) or snapshot.keys() != {cls._GENERATION_KEY, 'data'}:
+            return False
+        generation = snapshot[cls._GENERATION_KEY]
+        return (isinstance(generation, int) and not isinstance(generation, bool)
+                and isinstance(snapshot['data'], dict))
     
     def save(self):
         """Save data to file"""
+        with self._lock:
+            self._cancel_save_timer()
+            self._write_snapshot()
+    
+    def flush(self):
+        """Save now if there are unsaved changes"""
+        with self._lock:
+            self._cancel_save_timer()
+            if not self._dirty:
+                return
+            
+            log_limit = max(self.COMPACT_MIN_OPS, 2 * len(self.data))
+            if self._needs_snapshot or self._log_ops + len(self._pending) > log_limit:
+                self._write_snapshot()
+                return
+            
+            # Append just the changed keys rather than rewriting the whole store
+            lines = []
+            for key, value in self._pending.items():
+                if value is self._DELETED:
+                    op = {'gen': self._generation, 'delete': key}
+                else:
+                    op = {'gen': self._generation, 'set': [key, value]}
+                lines.append(json.dumps(op) + '\n')
+            try:
+                with open(self.log_filename, 'a') as f:
+                    f.write(''.join(lines))
+            except Exception:
+                # The log may now end in a partial line; keep the changes
+                # pending for a full snapshot
+                self._needs_snapshot = True
+                return
+            self._log_ops += len(lines)
+            self._pending.clear()
+            self._dirty = False
+    
+    def _write_snapshot(self):
+        """Rewrite the whole store and drop the change log (lock must be held)"""
+        generation = self._generation + 1
+        # Write a temp file and swap it in so a crash never leaves half a file
+        tmp_filename = self.filename + '.tmp'
         try:
-            with open(self.filename, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            with open(tmp_filename, 'wb') as f:
+                snapshot = {self._GENERATION_KEY: generation, 'data': self.data}
+                f.write(json.dumps(snapshot, indent=2).encode())
+            os.replace(tmp_filename, self.filename)
         except Exception:
-            pass
+            # Changes stay pending so the next flush retries them
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            return
+        self._generation = generation
+        self._dirty = False
+        self._pending.clear()
+        self._needs_snapshot = False
+        # Log lines from older generations are skipped on load, so a log
+        # that cannot be removed is stale rather than harmful
+        try:
+            if self._log_ops or os.path.exists(self.log_filename):
+                os.remove(self.log_filename)
+            self._log_ops = 0
+        except OSError:
+            # It may end in a partial line, so don't append to it
+            self._needs_snapshot = True
+    
+    @classmethod
+    def _flush_all(cls):
+        """Save unsaved changes of every live store"""
+        for store in list(cls._instances):
+            store.flush()
+    
+    def _cancel_save_timer(self):
+        """Cancel a scheduled save (lock must be held)"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+    
+    def _schedule_save(self):
+        """Mark data dirty and save after SAVE_DELAY (lock must be held)"""
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get value"""
@@ -6490,14 +7357,18 @@ class DataStore:
     
     def set(self, key: str, value: Any):
         """Set value"""
-        self.data[key] = value
-        self.save()
+        with self._lock:
+            self.data[key] = value
+            self._pending[key] = value
+            self._schedule_save()
     
     def delete(self, key: str):
         """Delete value"""
-        if key in self.data:
-            del self.data[key]
-            self.save()
+        with self._lock:
+            if key in self.data:
+                del self.data[key]
+                self._pending[key] = self._DELETED
+                self._schedule_save()
     
     def keys(self) -> List[str]:
         """Get all keys"""
@@ -6505,22 +7376,36 @@ class DataStore:
     
     def clear(self):
         """Clear all data"""
-        self.data.clear()
-        self.save()
+        with self._lock:
+            self.data.clear()
+            self._pending.clear()
+            self._needs_snapshot = True
+            self._schedule_save()
+
+atexit.register(DataStore._flush_all)
 
 # ============================================================================
 # EXTENDED UTILITY FUNCTIONS
 # ============================================================================
 
+ANSI_SGR_RE = re.compile(r'\x1b\[[0-9;]*m')
+
 def calculate_text_width(text: str) -> int:
     """Calculate display width of text (handling ANSI codes)"""
-    # Remove ANSI escape sequences
-    ansi_pattern = re.compile(r'\x1b\[[0-9;]*m')
-    clean_text = ansi_pattern.sub('', text)
-    return len(clean_text)
+    # Most UI strings carry no escapes at all
+    if '\x1b' not in text:
+        return len(text)
+    return len(ANSI_SGR_RE.sub('', text))
+
+PAD_ALIGN_SPECS = {'left': '<', 'right': '>', 'center': '^'}
 
 def pad_string(text: str, width: int, align: str = 'left', fill_char: str = ' ') -> str:
     """Pad string to specified width"""
+    # Plain text pads in one format() call; escapes need their width measured
+    spec = PAD_ALIGN_SPECS.get(align)
+    if spec is not None and len(fill_char) == 1 and '\x1b' not in text:
+        return format(text, f"{fill_char}{spec}{max(width, 0)}")
+    
     text_width = calculate_text_width(text)
     padding_needed = max(0, width - text_width)
     
@@ -6535,46 +7420,51 @@ def pad_string(text: str, width: int, align: str = 'left', fill_char: str = ' ')
     
     return text
 
+@functools.lru_cache(maxsize=64)
+def _table_borders(col_widths: Tuple[int, ...]) -> Tuple[str, str, str]:
+    """Top, header separator and bottom border lines for the column widths"""
+    segments = ['─' * (w + 2) for w in col_widths]
+    return (
+        '┌' + '┬'.join(segments) + '┐',
+        '├' + '┼'.join(segments) + '┤',
+        '└' + '┴'.join(segments) + '┘',
+    )
+
 def create_table(headers: List[str], rows: List[List[str]], 
                 col_widths: Optional[List[int]] = None) -> List[str]:
     """Create formatted table"""
     if not headers or not rows:
         return []
     
+    # Cells are stringified once, for both sizing and formatting
+    str_rows = [[str(cell) for cell in row] for row in rows]
+    
     # Calculate column widths if not provided
     if col_widths is None:
         col_widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                if i < len(col_widths):
-                    col_widths[i] = max(col_widths[i], len(str(cell)))
+        column_count = len(col_widths)
+        for row in str_rows:
+            for i, cell in enumerate(row[:column_count]):
+                if len(cell) > col_widths[i]:
+                    col_widths[i] = len(cell)
     
-    # Create table
-    table_lines = []
+    top, separator, bottom = _table_borders(tuple(col_widths))
     
-    # Top border
-    table_lines.append('┌' + '┬'.join('─' * (w + 2) for w in col_widths) + '┐')
+    # Create table
+    table_lines = [top]
     
     # Headers
-    header_row = '│'
-    for i, header in enumerate(headers):
-        if i < len(col_widths):
-            header_row += f" {header:<{col_widths[i]}} │"
-    table_lines.append(header_row)
+    table_lines.append('│' + ''.join(f" {header:<{w}} │" for header, w in zip(headers, col_widths)))
     
     # Header separator
-    table_lines.append('├' + '┼'.join('─' * (w + 2) for w in col_widths) + '┤')
+    table_lines.append(separator)
     
     # Data rows
-    for row in rows:
-        row_str = '│'
-        for i, cell in enumerate(row):
-            if i < len(col_widths):
-                row_str += f" {str(cell):<{col_widths[i]}} │"
-        table_lines.append(row_str)
+    for row in str_rows:
+        table_lines.append('│' + ''.join(f" {cell:<{w}} │" for cell, w in zip(row, col_widths)))
     
     # Bottom border
-    table_lines.append('└' + '┴'.join('─' * (w + 2) for w in col_widths) + '┘')
+    table_lines.append(bottom)
     
     return table_lines
 
@@ -6591,36 +7481,40 @@ def format_table_for_display(headers: List[str], rows: List[List[str]],
     output = []
     table_lines = create_table(headers, rows)
     
+    # Styles are fixed for the whole table
+    border_style = Color.rgb(*colors['border'])
+    header_style = Color.rgb(*colors['header']) + Color.bold()
+    data_style = Color.rgb(*colors['data'])
+    reset = Color.reset()
+    last = len(table_lines) - 1
+    
     for i, line in enumerate(table_lines):
-        output.append(Cursor.move(x, y + i))
-        
-        if i == 0 or i == len(table_lines) - 1:
+        if i == 0 or i == last:
             # Borders
-            output.append(Color.rgb(*colors['border']))
+            style = border_style
         elif i == 1:
             # Header
-            output.append(Color.rgb(*colors['header']))
-            output.append(Color.bold())
+            style = header_style
         elif i == 2:
             # Header separator
-            output.append(Color.rgb(*colors['border']))
+            style = border_style
         else:
             # Data
-            output.append(Color.rgb(*colors['data']))
+            style = data_style
         
-        output.append(line)
-        output.append(Color.reset())
+        output.append(f"{Cursor.move(x, y + i)}{style}{line}{reset}")
     
     return output
 
+ASCII_BOX_STYLES = {
+    'double': {'tl': '╔', 'tr': '╗', 'bl': '╚', 'br': '╝', 'h': '═', 'v': '║'},
+    'rounded': {'tl': '╭', 'tr': '╮', 'bl': '╰', 'br': '╯', 'h': '─', 'v': '│'},
+    'single': {'tl': '┌', 'tr': '┐', 'bl': '└', 'br': '┘', 'h': '─', 'v': '│'},
+}
+
 def create_ascii_box(width: int, height: int, title: str = "", style: str = "double") -> List[str]:
     """Create ASCII box with title"""
-    if style == "double":
-        chars = {'tl': '╔', 'tr': '╗', 'bl': '╚', 'br': '╝', 'h': '═', 'v': '║'}
-    elif style == "rounded":
-        chars = {'tl': '╭', 'tr': '╮', 'bl': '╰', 'br': '╯', 'h': '─', 'v': '│'}
-    else:
-        chars = {'tl': '┌', 'tr': '┐', 'bl': '└', 'br': '┘', 'h': '─', 'v': '│'}
+    chars = ASCII_BOX_STYLES.get(style, ASCII_BOX_STYLES['single'])
     
     lines = []
     
@@ -6635,19 +7529,20 @@ def create_ascii_box(width: int, height: int, title: str = "", style: str = "dou
     
     lines.append(top_line)
     
-    # Middle lines
-    for _ in range(height - 2):
-        lines.append(chars['v'] + ' ' * (width - 2) + chars['v'])
+    # Middle lines are all the same string
+    lines.extend([chars['v'] + ' ' * (width - 2) + chars['v']] * (height - 2))
     
     # Bottom line
     lines.append(chars['bl'] + chars['h'] * (width - 2) + chars['br'])
     
     return lines
 
+ANSI_RGB_RE = re.compile(r'\\x1b\[38;2;(\d+);(\d+);(\d+)m')
+
 def parse_ansi_color(code: str) -> Optional[Tuple[int, int, int]]:
     """Parse ANSI color code to RGB"""
     # Parse sequences like \x1b[38;2;R;G;Bm
-    match = re.match(r'\\x1b\[38;2;(\d+);(\d+);(\d+)m', code)
+    match = ANSI_RGB_RE.match(code)
     if match:
         return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
     return None
@@ -6658,29 +7553,32 @@ def generate_box_drawing_art(text: str, padding: int = 2) -> List[str]:
     max_width = max(len(line) for line in lines) if lines else 0
     box_width = max_width + (padding * 2)
     
-    art_lines = []
+    # Built once and shared by every line that needs them
+    edge = '═' * box_width
+    pad_str = ' ' * padding
+    blank_lines = ['║' + ' ' * box_width + '║'] * padding
     
     # Top
-    art_lines.append('╔' + '═' * box_width + '╗')
+    art_lines = ['╔' + edge + '╗']
     
     # Padding top
-    for _ in range(padding):
-        art_lines.append('║' + ' ' * box_width + '║')
+    art_lines.extend(blank_lines)
     
     # Content
     for line in lines:
-        padded_line = ' ' * padding + line.ljust(max_width) + ' ' * padding
-        art_lines.append('║' + padded_line + '║')
+        art_lines.append(f"║{pad_str}{line.ljust(max_width)}{pad_str}║")
     
     # Padding bottom
-    for _ in range(padding):
-        art_lines.append('║' + ' ' * box_width + '║')
+    art_lines.extend(blank_lines)
     
     # Bottom
-    art_lines.append('╚' + '═' * box_width + '╝')
+    art_lines.append('╚' + edge + '╝')
     
     return art_lines
 
+PROGRESS_DOTS = ('⠀', '⠁', '⠃', '⠇', '⠏', '⠟', '⠿', '⡿', '⣿')
+PROGRESS_BLOCKS = (' ', '▁', '▂', '▃', '▄', '▅', '▆', '▇', '█')
+
 def create_progress_indicator(percentage: float, width: int, style: str = "bar") -> str:
     """Create progress indicator string"""
     percentage = clamp(percentage, 0.0, 1.0)
@@ -6691,34 +7589,40 @@ def create_progress_indicator(percentage: float, width: int, style: str = "bar")
         return '█' * filled + '░' * empty
     
     elif style == "dots":
-        dots = ['⠀', '⠁', '⠃', '⠇', '⠏', '⠟', '⠿', '⡿', '⣿']
         filled = int(width * percentage)
-        partial = int((width * percentage - filled) * len(dots))
+        partial = int((width * percentage - filled) * len(PROGRESS_DOTS))
         
         result = '⣿' * filled
         if partial > 0 and filled < width:
-            result += dots[partial]
+            result += PROGRESS_DOTS[partial]
         result += '⠀' * max(0, width - filled - 1)
         
         return result
     
     elif style == "blocks":
-        blocks = [' ', '▁', '▂', '▃', '▄', '▅', '▆', '▇', '█']
-        result = ''
-        
-        for i in range(width):
-            pos = i / width
-            if pos < percentage:
-                block_index = int((percentage - pos) * width / len(blocks))
-                block_index = min(block_index, len(blocks) - 1)
-                result += blocks[block_index]
-            else:
-                result += ' '
+        if width <= 0:
+            return ''
+        
+        # Cells behind the front step down one block every len(PROGRESS_BLOCKS)
+        # cells, so the bar is a few runs built by string multiplication
+        step = len(PROGRESS_BLOCKS)
+        front = width * percentage
+        lit = min(width, math.ceil(front))
+        runs = []
+        start = 0
+        for block_index in range(step - 1, -1, -1):
+            end = max(start, min(lit, math.floor(front - step * block_index) + 1))
+            runs.append(PROGRESS_BLOCKS[block_index] * (end - start))
+            start = end
+        runs.append(' ' * (width - start))
         
-        return result
+        return ''.join(runs)
     
     return '█' * int(width * percentage) + '░' * (width - int(width * percentage))
 
+# Sparkline characters (0-7 height levels)
+SPARK_CHARS = '▁▂▃▄▅▆▇█'
+
 def create_sparkline(data: List[float], width: int) -> str:
     """Create sparkline visualization"""
     if not data or width <= 0:
@@ -6732,9 +7636,6 @@ def create_sparkline(data: List[float], width: int) -> str:
     if value_range == 0:
         value_range = 1
     
-    # Sparkline characters (0-7 height levels)
-    chars = ['▁', '▂', '▃', '▄', '▅', '▆', '▇', '█']
-    
     # Sample data to fit width
     if len(data) > width:
         step = len(data) / width
@@ -6742,15 +7643,8 @@ def create_sparkline(data: List[float], width: int) -> str:
     else:
         sampled_data = data
     
-    # Create sparkline
-    result = ''
-    for value in sampled_data:
-        normalized = (value - min_val) / value_range
-        char_index = int(normalized * (len(chars) - 1))
-        char_index = clamp(char_index, 0, len(chars) - 1)
-        result += chars[char_index]
-    
-    return result
+    # Every value lies within [min_val, max_val], so the index stays in 0..7
+    return ''.join([SPARK_CHARS[int((value - min_val) / value_range * 7)] for value in sampled_data])
 
 def create_histogram(data: List[float], bins: int = 10, width: int = 50, height: int = 10) -> List[str]:
     """Create ASCII histogram"""
@@ -6769,10 +7663,9 @@ def create_histogram(data: List[float], bins: int = 10, width: int = 50, height:
     bin_counts = [0] * bins
     
     # Count values in each bin
+    last_bin = bins - 1
     for value in data:
-        bin_index = int((value - min_val) / bin_width)
-        bin_index = min(bin_index, bins - 1)
-        bin_counts[bin_index] += 1
+        bin_counts[min(int((value - min_val) / bin_width), last_bin)] += 1
     
     # Normalize to height
     max_count = max(bin_counts)
@@ -6783,16 +7676,8 @@ def create_histogram(data: List[float], bins: int = 10, width: int = 50, height:
     lines = []
     
     for h in range(height, 0, -1):
-        line = ''
         threshold = (h / height) * max_count
-        
-        for count in bin_counts:
-            if count >= threshold:
-                line += '█'
-            else:
-                line += ' '
-        
-        lines.append(line)
+        lines.append(''.join(['█' if count >= threshold else ' ' for count in bin_counts]))
     
     # Add axis
     lines.append('─' * bins)
@@ -6805,25 +7690,19 @@ def create_histogram(data: List[float], bins: int = 10, width: int = 50, height:
     
     return lines
 
+# Curves for interpolate(); t is already clamped to 0..1
+INTERPOLATION_CURVES: Dict[str, Callable[[float], float]] = {
+    'linear': EasingFunction.linear,
+    'smooth': lambda t: t * t * (3 - 2 * t),
+    'ease_in': EasingFunction.ease_in_quad,
+    'ease_out': EasingFunction.ease_out_quad,
+    'ease_in_out': EasingFunction.ease_in_out_quad,
+}
+
 def interpolate(a: float, b: float, t: float, method: str = 'linear') -> float:
     """Interpolate between two values using various methods"""
     t = clamp(t, 0.0, 1.0)
-    
-    if method == 'linear':
-        return a + (b - a) * t
-    elif method == 'smooth':
-        return a + (b - a) * smoothstep(0, 1, t)
-    elif method == 'ease_in':
-        return a + (b - a) * (t * t)
-    elif method == 'ease_out':
-        return a + (b - a) * (t * (2 - t))
-    elif method == 'ease_in_out':
-        if t < 0.5:
-            return a + (b - a) * (2 * t * t)
-        else:
-            return a + (b - a) * (-1 + (4 - 2 * t) * t)
-    else:
-        return lerp(a, b, t)
+    return a + (b - a) * INTERPOLATION_CURVES.get(method, EasingFunction.linear)(t)
 
 def map_range(value: float, in_min: float, in_max: float, out_min: float, out_max: float) -> float:
     """Map value from one range to another"""
@@ -6839,9 +7718,12 @@ def denormalize_value(normalized: float, min_val: float, max_val: float) -> floa
     """Convert normalized value back to original range"""
     return min_val + (max_val - min_val) * normalized
 
-def calculate_checksum(data: str) -> str:
+def calculate_checksum(data: Union[str, bytes]) -> str:
     """Calculate checksum of data"""
-    return hashlib.sha256(data.encode()).hexdigest()[:8]
+    if isinstance(data, str):
+        data = data.encode()
+    # Not a security hash: a 4-byte BLAKE2b digest is the 8 hex chars shown
+    return hashlib.blake2b(data, digest_size=4, usedforsecurity=False).hexdigest()
 
 def validate_json(text: str) -> bool:
     """Validate JSON string"""
@@ -6853,43 +7735,35 @@ def validate_json(text: str) -> bool:
 
 def format_json(text: str, indent: int = 2) -> str:
     """Format JSON with indentation"""
+    # Blank fields are the common case and need no parsing
+    if not text.strip():
+        return text
     try:
+        # Stdlib on both sides: orjson rejects NaN and turns big ints into floats
         data = json.loads(text)
         return json.dumps(data, indent=indent)
     except:
         return text
 
+ESCAPE_TABLE = str.maketrans({
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+    '"': '\\"',
+    '\\': '\\\\',
+})
+
+UNESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+UNESCAPE_MAP = {'n': '\n', 'r': '\r', 't': '\t', '"': '"', '\\': '\\'}
+
 def escape_string(text: str) -> str:
     """Escape special characters in string"""
-    replacements = {
-        '\n': '\\n',
-        '\r': '\\r',
-        '\t': '\\t',
-        '"': '\\"',
-        '\\': '\\\\',
-    }
-    
-    result = text
-    for old, new in replacements.items():
-        result = result.replace(old, new)
-    
-    return result
+    return text.translate(ESCAPE_TABLE)
 
 def unescape_string(text: str) -> str:
     """Unescape special characters in string"""
-    replacements = {
-        '\\n': '\n',
-        '\\r': '\r',
-        '\\t': '\t',
-        '\\"': '"',
-        '\\\\': '\\',
-    }
-    
-    result = text
-    for old, new in replacements.items():
-        result = result.replace(old, new)
-    
-    return result
+    # One left-to-right pass, so an escaped backslash never starts another escape
+    return UNESCAPE_RE.sub(lambda match: UNESCAPE_MAP.get(match.group(1), match.group(0)), text)
 
 # ===========================================================================
 # COMPREHENSIVE EXAMPLES AND TEST DATA
@@ -6932,34 +7806,34 @@ EXAMPLE_ASCII_ART = {
 
 # Example color palettes
 COLOR_PALETTES = {
-    'ocean': [
+    'ocean': (
         (13, 27, 42),
         (27, 38, 59),
         (65, 90, 119),
         (119, 141, 169),
         (224, 251, 252)
-    ],
-    'sunset': [
+    ),
+    'sunset': (
         (25, 25, 112),
         (138, 43, 226),
         (255, 99, 71),
         (255, 165, 0),
         (255, 215, 0)
-    ],
-    'forest': [
+    ),
+    'forest': (
         (34, 139, 34),
         (85, 107, 47),
         (107, 142, 35),
         (154, 205, 50),
         (173, 255, 47)
-    ],
-    'fire': [
+    ),
+    'fire': (
         (139, 0, 0),
         (178, 34, 34),
         (220, 20, 60),
         (255, 69, 0),
         (255, 140, 0)
-    ],
+    ),
 }
 
 # Example command templates
@@ -6997,7 +7871,7 @@ COMMAND_TEMPLATES = {
 
 # Example keybinding configurations
 KEYBINDING_PRESETS = {
-    'vim': {
+    'vim': MappingProxyType({
         'h': 'cursor_left',
         'j': 'cursor_down',
         'k': 'cursor_up',
@@ -7009,8 +7883,8 @@ KEYBINDING_PRESETS = {
         'dd': 'delete_line',
         'yy': 'copy_line',
         'p': 'paste',
-    },
-    'emacs': {
+    }),
+    'emacs': MappingProxyType({
         '\x01': 'line_start',  # Ctrl+A
         '\x05': 'line_end',    # Ctrl+E
         '\x02': 'cursor_left',  # Ctrl+B
@@ -7019,12 +7893,12 @@ KEYBINDING_PRESETS = {
         '\x0e': 'history_next', # Ctrl+N
         '\x0b': 'delete_to_end', # Ctrl+K
         '\x19': 'paste',        # Ctrl+Y
-    },
+    }),
 }
 
 # Example theme configurations
 THEME_EXAMPLES = {
-    'monokai': {
+    'monokai': MappingProxyType({
         'background': (39, 40, 34),
         'foreground': (248, 248, 242),
         'black': (39, 40, 34),
@@ -7035,8 +7909,8 @@ THEME_EXAMPLES = {
         'magenta': (174, 129, 255),
         'cyan': (161, 239, 228),
         'white': (248, 248, 242),
-    },
-    'solarized_dark': {
+    }),
+    'solarized_dark': MappingProxyType({
         'background': (0, 43, 54),
         'foreground': (131, 148, 150),
         'black': (7, 54, 66),
@@ -7047,8 +7921,8 @@ THEME_EXAMPLES = {
         'magenta': (211, 54, 130),
         'cyan': (42, 161, 152),
         'white': (238, 232, 213),
-    },
-    'nord': {
+    }),
+    'nord': MappingProxyType({
         'background': (46, 52, 64),
         'foreground': (216, 222, 233),
         'black': (59, 66, 82),
@@ -7059,7 +7933,7 @@ THEME_EXAMPLES = {
         'magenta': (180, 142, 173),
         'cyan': (136, 192, 208),
         'white': (229, 233, 240),
-    },
+    }),
 }
 
 # Example plugin configurations
@@ -7181,16 +8055,14 @@ class Cache:
     
     def __init__(self, max_size: int = 100):
         self.max_size = max_size
-        self.cache: Dict[str, Any] = {}
-        self.access_order: deque = deque()
+        # Ordered least to most recently used
+        self.cache: OrderedDict = OrderedDict()
     
     def get(self, key: str) -> Optional[Any]:
         """Get cached value"""
         if key in self.cache:
             # Update access order
-            if key in self.access_order:
-                self.access_order.remove(key)
-            self.access_order.append(key)
+            self.cache.move_to_end(key)
             return self.cache[key]
         return None
     
@@ -7198,19 +8070,16 @@ class Cache:
         """Set cached value"""
         if key in self.cache:
             # Update existing
-            self.access_order.remove(key)
+            self.cache.move_to_end(key)
         elif len(self.cache) >= self.max_size:
             # Evict oldest
-            oldest = self.access_order.popleft()
-            del self.cache[oldest]
+            self.cache.popitem(last=False)
         
         self.cache[key] = value
-        self.access_order.append(key)
     
     def clear(self):
         """Clear cache"""
         self.cache.clear()
-        self.access_order.clear()
     
     def size(self) -> int:
         """Get cache size"""
@@ -9447,8 +10316,7 @@ def advanced_string_formatting(text: str, width: int, options: Dict[str, Any]) -
     
     # Strip ANSI codes if requested
     if options.get('strip_ansi', False):
-        ansi_pattern = re.compile(r'\x1b\[[0-9;]*m')
-        result = ansi_pattern.sub('', result)
+        result = ANSI_SGR_RE.sub('', result)
     
     # Trim whitespace
     if options.get('trim', True):